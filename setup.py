@@ -26,5 +26,8 @@ setup(
     install_requires=[
         "playwright>=1.42.0",
     ],
+    extras_require={
+        "numpy": ["numpy>=1.20"],
+    },
     python_requires=">=3.8",
 )
\ No newline at end of file
@@ -1,35 +1,232 @@
+import asyncio
+import json
+import time
+from collections import OrderedDict
+from typing import Any, AsyncIterator, Awaitable, Callable, Iterable, Optional, Tuple
 from playwright.async_api import async_playwright
+from .search_index import SearchIndex
 
 BASE_URL = "https://www.sofascore.com/api/v1"
 
+class SofascoreAPIError(Exception):
+    def __init__(self, message: str, status: int):
+        """
+        Raised when the API answers a request with a non-200 status.
+
+        Args:
+            message (str): The error message.
+            status (int): The HTTP status code of the response.
+        """
+        super().__init__(message)
+        self.status = status
+
+async def gather_not_found(*aws) -> list:
+    """
+    Runs the awaitables concurrently like ``asyncio.gather`` and returns one (result, status) pair for each.
+
+    A request the API answered with 404 gives (None, 404) instead of failing the whole batch, every other
+    result gives (result, None). Any other exception is raised once all awaitables have finished.
+    """
+    pairs = []
+    for result in await asyncio.gather(*aws, return_exceptions = True):
+        if isinstance(result, SofascoreAPIError) and result.status == 404:
+            pairs.append((None, result.status))
+        elif isinstance(result, BaseException):
+            raise result
+        else:
+            pairs.append((result, None))
+    return pairs
+
+class RateLimiter:
+    def __init__(self, rate: float, burst: int = None):
+        """
+        Token bucket limiting how many requests may start per second.
+
+        Args:
+            rate (float): The sustained number of requests allowed per second.
+            burst (int, optional): The number of requests that may start back to back. Defaults to ``rate`` rounded up.
+        """
+        self.rate = rate
+        self.burst = burst if burst is not None else max(1, int(rate + 0.999))
+        self.tokens = float(self.burst)
+        self.updated = time.monotonic()
+
+    def _refill(self):
+        now = time.monotonic()
+        self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    async def acquire(self, tokens: int = 1):
+        """
+        Waits until ``tokens`` requests may be started and consumes them.
+        """
+        while True:
+            self._refill()
+            if self.tokens >= tokens:
+                self.tokens -= tokens
+                return
+            await asyncio.sleep((tokens - self.tokens) / self.rate)
+
+async def bounded_map(
+    items: Iterable[Any],
+    work: Callable[[Any], Awaitable[Any]],
+    concurrency: int
+) -> AsyncIterator[Tuple[Any, Any, Optional[Exception]]]:
+    """
+    Runs ``work`` on every item with ``concurrency`` workers and yields (item, result, error) in completion order.
+
+    The workers share one iterator, so every item is taken by exactly one worker and a lazy iterable is only
+    read as fast as workers become free. At most ``concurrency`` finished results wait for the consumer; after
+    that the workers pause until it catches up. An item whose work fails yields (item, None, exception)
+    instead of stopping the others. If reading ``items`` raises, the items already taken are still yielded and
+    the exception is then raised to the consumer. Closing the iterator cancels the running work.
+    """
+    concurrency = max(1, concurrency)
+    items = iter(items)
+    results = asyncio.Queue(maxsize = concurrency)
+    done = object()
+
+    async def worker():
+        for item in items:
+            try:
+                result, error = await work(item), None
+            except Exception as exc:
+                result, error = None, exc
+            await results.put((item, result, error))
+
+    workers = [asyncio.ensure_future(worker()) for _ in range(concurrency)]
+
+    async def produce():
+        # Only reading items can fail here, work() errors are yielded per item. The other workers
+        # still finish the items they hold before the failure is passed on.
+        for outcome in await asyncio.gather(*workers, return_exceptions = True):
+            if isinstance(outcome, Exception):
+                await results.put(outcome)
+                break
+        await results.put(done)
+
+    producer = asyncio.ensure_future(produce())
+    try:
+        while True:
+            entry = await results.get()
+            if entry is done:
+                return
+            if isinstance(entry, Exception):
+                raise entry
+            yield entry
+    finally:
+        producer.cancel()
+        for task in workers:
+            task.cancel()
+
 class SofascoreAPI:
-    def __init__(self):
+    def __init__(self, max_concurrency: int = 4, cache_size: int = 10000):
+        """
+        Args:
+            max_concurrency (int, optional): The number of browser pages used to run requests in parallel. Defaults to 4.
+            cache_size (int, optional): The maximum number of responses kept by ``_get_cached``. Defaults to 10000.
+
+        Attributes:
+            search_index (SearchIndex): The entities seen in this client's search results, used by ``Search.autocomplete``.
+        """
         self.browser = None
         self.page = None
         self.playwright = None
+        self.max_concurrency = max(1, max_concurrency)
+        self._pages = []
+        self._opening = 0
+        self._idle_pages = None
+        self._init_lock = None
+        self._in_flight = {}
+        self.cache_size = max(1, cache_size)
+        self._cache = OrderedDict()
+        self._resolved_rounds = {}
+        self.search_index = SearchIndex()
 
     async def _init_browser(self):
-        if self.playwright is None:
-            self.playwright = await async_playwright().start()
-            self.browser = await self.playwright.chromium.launch(headless=True)
-            self.page = await self.browser.new_page()
+        if self._init_lock is None:
+            self._init_lock = asyncio.Lock()
+        async with self._init_lock:
+            if self.playwright is None:
+                self.playwright = await async_playwright().start()
+                self.browser = await self.playwright.chromium.launch(headless=True)
+                self.page = await self.browser.new_page()
+                self._pages = [self.page]
+                self._idle_pages = asyncio.Queue()
+                self._idle_pages.put_nowait(self.page)
 
-    async def _get(self, endpoint):
+    async def _acquire_page(self):
         await self._init_browser()
-        url = f"{BASE_URL}{endpoint}"
-        response = await self.page.goto(url)
-        if response.status == 200:
-            return await response.json()
+        # The slot is reserved before awaiting new_page, so concurrent callers cannot open more than max_concurrency pages
+        if self._idle_pages.empty() and len(self._pages) + self._opening < self.max_concurrency:
+            self._opening += 1
+            try:
+                page = await self.browser.new_page()
+            finally:
+                self._opening -= 1
+            self._pages.append(page)
+            return page
+        return await self._idle_pages.get()
+
+    async def _goto(self, url):
+        page = await self._acquire_page()
+        try:
+            response = await page.goto(url)
+            return response.status, (await response.text() if response.status == 200 else None)
+        finally:
+            self._idle_pages.put_nowait(page)
+
+    async def _fetch_text(self, url, name):
+        # Identical requests that are already in flight share one navigation. The body is kept as text
+        # so that every caller gets its own parsed copy and can safely modify it.
+        task = self._in_flight.get(url)
+        if task is None:
+            task = asyncio.ensure_future(self._goto(url))
+            self._in_flight[url] = task
+            task.add_done_callback(lambda _: self._in_flight.pop(url, None))
+
+        status, body = await asyncio.shield(task)
+        if status == 200:
+            return body
         else:
-            raise Exception(f"Failed to fetch {endpoint}: {response.status}")
+            raise SofascoreAPIError(f"Failed to fetch {name}: {status}", status)
+
+    async def _fetch(self, url, name):
+        return json.loads(await self._fetch_text(url, name))
+
+    async def _get(self, endpoint):
+        return await self._fetch(f"{BASE_URL}{endpoint}", endpoint)
+
+    async def _get_cached(self, endpoint, ttl: float = None, key: str = None):
+        """
+        Like ``_get``, but keeps the response for ``ttl`` seconds, or for the lifetime of the client when
+        ``ttl`` is None. Meant for data that no longer changes, such as finished rounds and past seasons.
+        Once more than ``cache_size`` responses are kept, the least recently used ones are dropped.
+
+        ``key`` stores the response under another name than the endpoint, e.g. to tie it to a version of
+        the data it depends on.
+        """
+        key = key or endpoint
+        cached = self._cache.get(key)
+        if cached is not None and (cached[0] is None or cached[0] > time.monotonic()):
+            self._cache.move_to_end(key)
+            return json.loads(cached[1])
+
+        body = await self._fetch_text(f"{BASE_URL}{endpoint}", endpoint)
+        self._cache[key] = (None if ttl is None else time.monotonic() + ttl, body)
+        self._cache.move_to_end(key)
+        while len(self._cache) > self.cache_size:
+            self._cache.popitem(last = False)
+        return json.loads(body)
+
+    def clear_cache(self):
+        """
+        Drops every response kept by ``_get_cached``.
+        """
+        self._cache.clear()
 
     async def _raw_get(self, url):
-        await self._init_browser()
-        response = await self.page.goto(url)
-        if response.status == 200:
-            return await response.json()
-        else:
-            raise Exception(f"Failed to fetch {url}: {response.status}")
+        return await self._fetch(url, url)
 
     async def close(self):
         if self.browser:
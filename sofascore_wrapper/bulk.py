@@ -0,0 +1,103 @@
+from .api import SofascoreAPI, RateLimiter, bounded_map
+from .match import Match, SNAPSHOT_PARTS
+from typing import Dict, Any, Iterable, AsyncIterator, Tuple
+from pathlib import Path
+
+DEFAULT_ENRICH_PARTS = ("stats", "lineups_home", "lineups_away", "incidents", "shotmap")
+
+class MatchEnricher:
+    def __init__(
+        self,
+        api: SofascoreAPI,
+        include: Iterable[str] = DEFAULT_ENRICH_PARTS,
+        concurrency: int = 8,
+        rate: float = 10.0,
+        checkpoint: str = None
+    ):
+        """
+        Enriches large numbers of events with per-match resources using ``Match.snapshot``.
+
+        Events are processed by ``concurrency`` workers, each request waiting for the shared rate limit,
+        and results are yielded in completion order. Workers pause while ``concurrency`` results are waiting
+        to be consumed, so little finished work is lost if the job stops. When a checkpoint file is given, the
+        ID of every event whose result has been consumed is appended to it, and events already listed there are
+        skipped on the next run, so an interrupted job resumes where it stopped.
+
+        Args:
+            api (SofascoreAPI): An instance of the SofascoreAPI class.
+            include (Iterable[str], optional): The ``Match`` methods to fetch for every event. Defaults to stats,
+                lineups_home, lineups_away, incidents and shotmap.
+            concurrency (int, optional): The number of events processed at the same time. Defaults to 8.
+            rate (float, optional): The maximum number of requests started per second. Defaults to 10.0.
+            checkpoint (str, optional): The path of the checkpoint file. Defaults to no checkpointing.
+
+        Raises:
+            ValueError: If an included name is not one of ``SNAPSHOT_PARTS``.
+        """
+        self.include = tuple(include)
+        for name in self.include:
+            if name not in SNAPSHOT_PARTS:
+                raise ValueError(f"Invalid part: {name}. Must be one of {list(SNAPSHOT_PARTS)}")
+
+        self.api = api
+        self.concurrency = max(1, concurrency)
+        self.limiter = RateLimiter(rate)
+        self.checkpoint = Path(checkpoint) if checkpoint else None
+        self.completed = set()
+        self.errors = {}
+
+        if self.checkpoint and self.checkpoint.exists():
+            with open(self.checkpoint, "r", encoding="utf-8") as file:
+                self.completed = {int(line) for line in file if line.strip()}
+
+    async def _enrich(self, event_id: int) -> Dict[str, Any]:
+        for _ in self.include:
+            await self.limiter.acquire()
+        return await Match(self.api, event_id).snapshot(include = self.include)
+
+    async def run(self, event_ids: Iterable[int]) -> AsyncIterator[Tuple[int, Dict[str, Any]]]:
+        """
+        Enriches the given events and yields each result as soon as it is ready.
+
+        Events listed in the checkpoint and duplicate IDs are skipped. Events that fail are not yielded
+        or checkpointed; their exception is kept in ``errors`` so they are retried on the next run.
+
+        Args:
+            event_ids (Iterable[int]): The IDs of the events. May be a lazy iterable.
+
+        Returns:
+            AsyncIterator[Tuple[int, Dict[str, Any]]]: Tuples of (event_id, snapshot) where snapshot is
+                the dictionary returned by ``Match.snapshot``.
+
+        Example Usage:
+            .. code-block:: python
+
+                api = SofascoreAPI(max_concurrency = 16)
+                enricher = MatchEnricher(api, concurrency = 16, rate = 20, checkpoint = "enrich.chk")
+                async for event_id, snapshot in enricher.run(finished_ids):
+                    save(event_id, snapshot)
+        """
+        def pending():
+            seen = set()
+            for event_id in event_ids:
+                if event_id not in self.completed and event_id not in seen:
+                    seen.add(event_id)
+                    yield event_id
+
+        results = bounded_map(pending(), self._enrich, self.concurrency)
+        checkpoint = open(self.checkpoint, "a", encoding="utf-8") if self.checkpoint else None
+        try:
+            async for event_id, snapshot, error in results:
+                if error is not None:
+                    self.errors[event_id] = error
+                    continue
+                yield event_id, snapshot
+
+                self.completed.add(event_id)
+                if checkpoint:
+                    checkpoint.write(f"{event_id}\n")
+                    checkpoint.flush()
+        finally:
+            await results.aclose()
+            if checkpoint:
+                checkpoint.close()
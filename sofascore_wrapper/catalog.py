@@ -0,0 +1,213 @@
+from .api import SofascoreAPI
+from typing import Dict, List, Any, Iterable, Optional
+from pathlib import Path
+import asyncio
+import json
+import time
+
+class Catalog:
+    ENUMS_PATH = Path(__file__).parent / "tools" / "enums.json"
+
+    with open(ENUMS_PATH, "r", encoding="utf-8") as file:
+        ENUMS = json.load(file)
+
+    def __init__(self, api: SofascoreAPI):
+        """
+        A local index of categories, unique tournaments and their seasons for chosen sports.
+
+        ``build`` crawls the sports concurrently; afterwards lookups such as the current season of a
+        tournament are dictionary hits. Along with its seasons, every tournament's start and end dates are
+        fetched from ``/unique-tournament/{id}``, so ``refresh`` only re-fetches the seasons of tournaments
+        whose season is about to start or end, or whose seasons have not been fetched for a long time. The
+        catalog can be saved to and loaded from a JSON file. Failed requests are skipped; the latest error for
+        each ("category" | "seasons" | "dates", ID) pair is kept in ``errors``.
+
+        Args:
+            api (SofascoreAPI): An instance of the SofascoreAPI class.
+        """
+        self.api = api
+        self.enums = self.ENUMS
+        self.categories = {}
+        self.tournaments = {}
+        self.seasons = {}
+        self.refreshed = {}
+        self.errors = {}
+        self._by_slug = {}
+        self._by_name = {}
+
+    def _index(self, tournament: Dict[str, Any]):
+        self.tournaments[tournament["id"]] = tournament
+        for index, key in ((self._by_slug, tournament.get("slug")), (self._by_name, tournament.get("name"))):
+            if key:
+                ids = index.setdefault(key.lower(), [])
+                if tournament["id"] not in ids:
+                    ids.append(tournament["id"])
+
+    async def _crawl_sport(self, sport: str) -> List[int]:
+        data = await self.api._get(f"/sport/{sport}/categories")
+        categories = data.get("categories", [])
+        for category in categories:
+            self.categories[category["id"]] = dict(category, sport = sport)
+
+        results = await asyncio.gather(*(
+            self.api._get(f"/category/{category['id']}/unique-tournaments") for category in categories
+        ), return_exceptions = True)
+
+        tournament_ids = []
+        for category, result in zip(categories, results):
+            if isinstance(result, Exception):
+                self.errors[("category", category["id"])] = result
+                continue
+            self.errors.pop(("category", category["id"]), None)
+            for group in result.get("groups", []):
+                for tournament in group.get("uniqueTournaments", []):
+                    self._index(dict(tournament, sport = sport, category_id = category["id"]))
+                    tournament_ids.append(tournament["id"])
+        return tournament_ids
+
+    async def _fetch_seasons(self, tournament_id: int) -> bool:
+        seasons, details = await asyncio.gather(
+            self.api._get(f"/unique-tournament/{tournament_id}/seasons"),
+            self.api._get(f"/unique-tournament/{tournament_id}"),
+            return_exceptions = True
+        )
+
+        if isinstance(details, Exception):
+            self.errors[("dates", tournament_id)] = details
+        else:
+            self.errors.pop(("dates", tournament_id), None)
+            details = details.get("uniqueTournament", details)
+            for key in ("startDateTimestamp", "endDateTimestamp"):
+                if details.get(key):
+                    self.tournaments[tournament_id][key] = details[key]
+
+        if isinstance(seasons, Exception):
+            self.errors[("seasons", tournament_id)] = seasons
+            return False
+        self.errors.pop(("seasons", tournament_id), None)
+        self.seasons[tournament_id] = seasons.get("seasons", [])
+        self.refreshed[tournament_id] = time.time()
+        return True
+
+    async def build(self, sports: Iterable[str]) -> int:
+        """
+        Crawls the categories, unique tournaments and seasons of the given sports concurrently.
+
+        Args:
+            sports (Iterable[str]): The sport names, as used by ``Match.games_by_date``, e.g. ["football", "tennis"].
+
+        Returns:
+            int: The number of tournaments in the catalog.
+
+        Raises:
+            ValueError: If a sport is not a valid sport name.
+            Exception: If fetching the categories of a sport fails.
+        """
+        sports = [sport.lower().replace(' ', '-') for sport in sports]
+        for sport in sports:
+            if sport not in self.enums["sports"]:
+                raise ValueError(f"Invalid sport: {sport}. Must be one of {list(self.enums['sports'].keys())}")
+
+        crawled = await asyncio.gather(*(self._crawl_sport(sport) for sport in sports))
+        tournament_ids = list(dict.fromkeys(tournament_id for ids in crawled for tournament_id in ids))
+        await asyncio.gather(*(self._fetch_seasons(tournament_id) for tournament_id in tournament_ids))
+        return len(self.tournaments)
+
+    def stale(self, window: float = 7 * 24 * 60 * 60, min_age: float = 24 * 60 * 60, max_age: float = 30 * 24 * 60 * 60) -> List[int]:
+        """
+        Lists the tournaments whose seasons should be fetched again.
+
+        A tournament is stale when its seasons were last fetched more than ``max_age`` seconds ago, or
+        when the current time is within ``window`` seconds of its season's ``startDateTimestamp`` or
+        ``endDateTimestamp`` and its seasons are older than ``min_age``. It is also stale once more than
+        ``window`` seconds have passed since the season's end if its seasons were last fetched before
+        that, so the dates of the next season are picked up. Tournaments whose seasons could not be
+        fetched at all are always stale.
+
+        Args:
+            window (float, optional): Seconds around a season's start or end. Defaults to 7 days.
+            min_age (float, optional): The minimum age of seasons near a boundary before they are fetched again. Defaults to 1 day.
+            max_age (float, optional): The maximum age of seasons of any tournament. Defaults to 30 days.
+
+        Returns:
+            List[int]: The IDs of the stale tournaments.
+        """
+        now = time.time()
+        stale = []
+        for tournament_id, tournament in self.tournaments.items():
+            boundaries = [tournament[key] for key in ("startDateTimestamp", "endDateTimestamp") if tournament.get(key)]
+            end = tournament.get("endDateTimestamp")
+            refreshed = self.refreshed.get(tournament_id, 0)
+            if tournament_id not in self.seasons or now - refreshed > max_age:
+                stale.append(tournament_id)
+            elif any(abs(now - boundary) <= window for boundary in boundaries) and now - refreshed > min_age:
+                stale.append(tournament_id)
+            elif end and now > end + window and refreshed < end + window:
+                stale.append(tournament_id)
+        return stale
+
+    async def refresh(self, window: float = 7 * 24 * 60 * 60, min_age: float = 24 * 60 * 60, max_age: float = 30 * 24 * 60 * 60) -> List[int]:
+        """
+        Fetches the seasons of the tournaments returned by ``stale`` concurrently.
+
+        Returns:
+            List[int]: The IDs of the tournaments that were refreshed. Failures are kept in ``errors``.
+        """
+        stale = self.stale(window, min_age, max_age)
+        results = await asyncio.gather(*(self._fetch_seasons(tournament_id) for tournament_id in stale))
+        return [tournament_id for tournament_id, refreshed in zip(stale, results) if refreshed]
+
+    def find(self, query: Any, sport: str = None) -> List[Dict[str, Any]]:
+        """
+        Looks tournaments up by ID, slug or name (case-insensitive).
+
+        Args:
+            query (Any): A tournament ID, slug or name, e.g. 17, "premier-league" or "Premier League".
+            sport (str, optional): Only return tournaments of this sport.
+
+        Returns:
+            List[Dict[str, Any]]: The matching tournaments.
+        """
+        if isinstance(query, int):
+            ids = [query] if query in self.tournaments else []
+        else:
+            key = str(query).lower()
+            ids = self._by_slug.get(key, []) + [
+                tournament_id for tournament_id in self._by_name.get(key, []) if tournament_id not in self._by_slug.get(key, [])
+            ]
+        return [self.tournaments[tournament_id] for tournament_id in ids if sport is None or self.tournaments[tournament_id]["sport"] == sport]
+
+    def current_season(self, tournament_id: int) -> Optional[Dict[str, Any]]:
+        """
+        Returns the current (most recent) season of a tournament, or None if its seasons are unknown.
+        """
+        seasons = self.seasons.get(tournament_id)
+        return seasons[0] if seasons else None
+
+    def save(self, path: str):
+        """
+        Writes the catalog to a JSON file.
+        """
+        with open(path, "w", encoding="utf-8") as file:
+            json.dump({
+                "categories": list(self.categories.values()),
+                "tournaments": list(self.tournaments.values()),
+                "seasons": {str(key): value for key, value in self.seasons.items()},
+                "refreshed": {str(key): value for key, value in self.refreshed.items()}
+            }, file)
+
+    @classmethod
+    def load(cls, api: SofascoreAPI, path: str) -> "Catalog":
+        """
+        Reads a catalog written by ``save``.
+        """
+        with open(path, "r", encoding="utf-8") as file:
+            data = json.load(file)
+
+        catalog = cls(api)
+        catalog.categories = {category["id"]: category for category in data.get("categories", [])}
+        for tournament in data.get("tournaments", []):
+            catalog._index(tournament)
+        catalog.seasons = {int(key): value for key, value in data.get("seasons", {}).items()}
+        catalog.refreshed = {int(key): value for key, value in data.get("refreshed", {}).items()}
+        return catalog
@@ -1,9 +1,16 @@
-from .api import SofascoreAPI
-from typing import List, Dict, Any, Literal, Optional
+from .api import SofascoreAPI, SofascoreAPIError
+from .standings import StandingsTable
+from typing import List, Dict, Any, Literal, Optional, Tuple
+import asyncio
+import time
 
 BASE_URL = "https://www.sofascore.com/api/v1"
 
 class League:
+    RESOLVED_TTL = 600
+    ROUND_DURATION = 3 * 60 * 60
+    UNPLAYED_TYPES = ("postponed", "canceled")
+
     def __init__(self, api: SofascoreAPI, league_id: int):
         """
         Initialize the League class with the API and league ID.
@@ -15,6 +22,11 @@ class League:
         self.api = api
         self.league_id = league_id
 
+    @property
+    def _resolved(self) -> Dict[int, Dict[str, Any]]:
+        # Resolved (season, round) per league, shared by every League instance of the same client
+        return self.api._resolved_rounds
+
     async def get_league(self) -> dict:
         """
         Fetch general information about the league.
@@ -842,6 +854,40 @@ class League:
         """
         return await self.api._get(f"/unique-tournament/{self.league_id}/season/{season}/standings/away")
 
+    async def standings_all(self, season: int) -> Dict[str, StandingsTable]:
+        """
+        Fetch the total, home and away standings concurrently as columnar tables.
+
+        Requires NumPy, install it with ``pip install sofascore-wrapper[numpy]``.
+
+        Args:
+            season (int): The season ID to fetch standings for.
+
+        Returns:
+            Dict[str, StandingsTable]: The "total", "home" and "away" tables. Each holds the columns team_id,
+                group, position, matches, wins, draws, losses, goals_for, goals_against and points as arrays.
+
+        Raises:
+            Exception: If the API request fails.
+            ImportError: If NumPy is not installed.
+
+        Example Usage:
+            .. code-block:: python
+
+                tables = await league.standings_all(61627)
+                tables["home"].row(44)  # {"team_id": 44, "position": 1, "points": 30, ...}
+        """
+        total, home, away = await asyncio.gather(
+            self.standings(season),
+            self.standings_home(season),
+            self.standings_away(season)
+        )
+        return {
+            "total": StandingsTable.from_standings(total),
+            "home": StandingsTable.from_standings(home),
+            "away": StandingsTable.from_standings(away)
+        }
+
     async def player_of_the_season(self, season: int) -> Dict:
         """
         Get the player of the season for a specific season.
@@ -1289,6 +1335,82 @@ class League:
         """
         return await self.api._get(f"/unique-tournament/{self.league_id}/season/{season}/team-of-the-week/{round}")
 
+    async def totw_season(self, season: int) -> Dict[str, Any]:
+        """
+        Fetch the team of the week of every round in a season concurrently and index the selected players.
+
+        Every round except the most recent one is final and is kept for the lifetime of the API client, so
+        repeated calls only fetch the rounds list and the latest round.
+
+        Args:
+            season (int): The season ID to fetch the teams of the week for.
+
+        Returns:
+            Dict[str, Any]: A dictionary containing:
+                - rounds (Dict[int, Dict[str, Any]]): The ``totw`` response of each round, keyed by round ID.
+                - players (Dict[int, Dict[str, Any]]): One entry per selected player, keyed by player ID, with
+                  the player's name, number of appearances, the round IDs and ratings of those appearances,
+                  and the average rating.
+
+        Raises:
+            Exception: If the API request fails.
+
+        Example Response:
+            .. code-block:: python
+            {
+                "rounds": {16987: {"formation": "3-4-3", "players": [...]}},
+                "players": {
+                    997830: {
+                        "name": "Jakub Stolarczyk",
+                        "appearances": 2,
+                        "rounds": [16412, 16987],
+                        "ratings": [8.4, 8.1],
+                        "average_rating": 8.25
+                    }
+                }
+            }
+
+        Example Usage:
+            .. code-block:: python
+
+                totw = await league.totw_season(61627)
+                most = sorted(totw["players"].values(), key = lambda x: x["appearances"], reverse = True)[:10]
+        """
+        data = await self.totw_rounds(season)
+        rounds = sorted(data.get("rounds", []), key = lambda x: x.get("createdAtTimestamp", 0))
+        latest = rounds[-1]["id"] if rounds else None
+
+        async def fetch(round_id):
+            endpoint = f"/unique-tournament/{self.league_id}/season/{season}/team-of-the-week/{round_id}"
+            if round_id == latest:
+                return await self.api._get(endpoint)
+            return await self.api._get_cached(endpoint)
+
+        round_ids = [entry["id"] for entry in rounds]
+        results = await asyncio.gather(*(fetch(round_id) for round_id in round_ids))
+
+        players = {}
+        for round_id, team in zip(round_ids, results):
+            for entry in team.get("players", []):
+                player = players.setdefault(entry["player"]["id"], {
+                    "name": entry["player"].get("name"),
+                    "appearances": 0,
+                    "rounds": [],
+                    "ratings": []
+                })
+                player["appearances"] += 1
+                player["rounds"].append(round_id)
+                if entry.get("rating") is not None:
+                    player["ratings"].append(float(entry["rating"]))
+
+        for player in players.values():
+            player["average_rating"] = sum(player["ratings"]) / len(player["ratings"]) if player["ratings"] else None
+
+        return {
+            "rounds": dict(zip(round_ids, results)),
+            "players": players
+        }
+
     async def rounds(self, season: int) -> Dict:
         """
         Get the available rounds for a specific season.
@@ -1461,6 +1583,137 @@ class League:
         return await self.api._get(f"/unique-tournament/{self.league_id}/season/{season}/round/{round}")
 
     
+    async def all_fixtures(self, season: int) -> Dict[str, Any]:
+        """
+        Fetch every fixture of a season by requesting all of its rounds concurrently.
+
+        Rounds with a slug, such as cup rounds, are requested with it. Rounds without any events (404) are
+        skipped. An event listed in several rounds appears once in "events" and "by_id" and under each of
+        its rounds in "by_round".
+
+        Args:
+            season (int): The season ID to fetch fixtures for.
+
+        Returns:
+            Dict[str, Any]: A dictionary containing:
+                - events (List[Dict[str, Any]]): Every event of the season, sorted by ``startTimestamp``.
+                - by_id (Dict[int, Dict[str, Any]]): The events keyed by event ID.
+                - by_team (Dict[int, List[int]]): The event IDs of each team, in kick-off order.
+                - by_round (Dict[Tuple[int, Optional[str]], List[int]]): The event IDs of each (round, slug) pair, in kick-off order.
+
+        Raises:
+            Exception: If the API request fails.
+
+        Example Response:
+            .. code-block:: python
+            {
+                "events": [...],
+                "by_id": {12436870: {...}},
+                "by_team": {42: [12436870, 12436881]},
+                "by_round": {(1, None): [12436870]}
+            }
+        """
+        data = await self.rounds(season)
+        rounds = [(entry["round"], entry.get("slug")) for entry in data.get("rounds", [])]
+        rounds = list(dict.fromkeys(rounds))
+
+        async def fetch(round, slug):
+            endpoint = f"/unique-tournament/{self.league_id}/season/{season}/events/round/{round}"
+            try:
+                data = await self.api._get(f"{endpoint}/slug/{slug}" if slug else endpoint)
+            except SofascoreAPIError as exc:
+                if exc.status == 404:
+                    return []
+                raise
+            return data.get("events", [])
+
+        results = await asyncio.gather(*(fetch(round, slug) for round, slug in rounds))
+
+        by_id = {}
+        round_ids = {}
+        for key, events in zip(rounds, results):
+            for event in events:
+                by_id.setdefault(event["id"], event)
+                round_ids.setdefault(key, []).append(event["id"])
+
+        events = sorted(by_id.values(), key = lambda x: x.get("startTimestamp", 0))
+        order = {event["id"]: index for index, event in enumerate(events)}
+
+        by_team = {}
+        for event in events:
+            for side in ("homeTeam", "awayTeam"):
+                team_id = event.get(side, {}).get("id")
+                if team_id is not None:
+                    by_team.setdefault(team_id, []).append(event["id"])
+
+        by_round = {
+            key: sorted(dict.fromkeys(ids), key = order.get)
+            for key, ids in round_ids.items()
+        }
+
+        return {
+            "events": events,
+            "by_id": by_id,
+            "by_team": by_team,
+            "by_round": by_round
+        }
+
+    async def _resolve_current(self) -> Dict[str, Any]:
+        season_obj = await self.current_season()
+        season = season_obj["id"]
+        entry = {
+            "season": season,
+            "round": await self.current_round(season),
+            "expires": time.time() + self.RESOLVED_TTL,
+            "round_ends": None,
+            "refreshing": None
+        }
+        self._resolved[self.league_id] = entry
+        return entry
+
+    async def _current_season_round(self) -> Tuple[int, int]:
+        """
+        Returns the current (season ID, round) of the league, resolving it only when needed.
+
+        The resolved pair is kept for ``RESOLVED_TTL`` seconds. After that it is still returned while a
+        refresh runs in the background. It is resolved again before returning once the expected end of the
+        round has passed, as the current round is then likely to have moved on. Postponed and canceled events
+        do not count towards that end. A round whose end has already passed when it is resolved, such as the
+        last round after the season has ended, only follows the TTL.
+        """
+        entry = self._resolved.get(self.league_id)
+        now = time.time()
+
+        if entry is None or (entry["round_ends"] is not None and now >= entry["round_ends"]):
+            entry = await self._resolve_current()
+        elif now >= entry["expires"] and entry["refreshing"] is None:
+            entry["refreshing"] = asyncio.ensure_future(self._resolve_current())
+            entry["refreshing"].add_done_callback(lambda task: self._refresh_done(entry, task))
+
+        return entry["season"], entry["round"]
+
+    @staticmethod
+    def _refresh_done(entry: Dict[str, Any], task: asyncio.Future):
+        # A failed background refresh keeps the stale entry and is retried on the next call
+        if task.cancelled() or task.exception() is not None:
+            entry["refreshing"] = None
+
+    def _note_round_events(self, season: int, round: int, events: List[Dict[str, Any]]):
+        # Remember when the resolved round is expected to be over, so the next call re-resolves it
+        entry = self._resolved.get(self.league_id)
+        if entry is None or (entry["season"], entry["round"]) != (season, round) or not events:
+            return
+
+        scheduled = [event for event in events if event.get("status", {}).get("type") not in self.UNPLAYED_TYPES]
+        round_ends = max((event.get("startTimestamp", 0) for event in scheduled), default = 0) + self.ROUND_DURATION
+        if all(event.get("status", {}).get("type") == "finished" for event in scheduled) or round_ends <= time.time():
+            # The round is already over but still reported as current, e.g. off-season, a finished cup or a
+            # round left with only postponed events. Re-resolving now would only find it again, so leave it
+            # to the TTL and the background refresh.
+            entry["round_ends"] = None
+        else:
+            entry["round_ends"] = round_ends
+
     async def next_fixtures(self) -> Dict[Dict, Any]:
         """
         Fetch the next fixtures for the current season and round.
@@ -1573,14 +1826,7 @@ class League:
         ]
 
         """
-        season_obj = await self.current_season()
-        season = season_obj["id"]
-        round = await self.current_round(season)
-
-        data = await self.api._get(f"/unique-tournament/{self.league_id}/season/{season}/events/round/{round}")
-        fixtures = [event for event in data.get("events", []) if event.get("status", {}).get("code") == 0]
-
-        return sorted(fixtures, key = lambda x: x["startTimestamp"]) if fixtures else None
+        return (await self._current_fixtures(("next",)))["next"]
     
     async def last_fixtures(self) -> Dict[Dict, Any]:
         """
@@ -1695,24 +1941,76 @@ class League:
         ]
 
         """
-        season_obj = await self.current_season()
-        season = season_obj["id"]
-        round_obj = await self.current_round(season)
+        return (await self._current_fixtures(("last",)))["last"]
+
+    async def _current_fixtures(self, which: Tuple[str, ...]) -> Dict[str, Optional[List[Dict[str, Any]]]]:
+        season, round = await self._current_season_round()
 
-        data = await self.api._get(f"/unique-tournament/{self.league_id}/season/{season}/events/round/{round_obj}")
+        data = await self.api._get(f"/unique-tournament/{self.league_id}/season/{season}/events/round/{round}")
+        events = data.get("events", [])
+        self._note_round_events(season, round, events)
+        result = {}
+
+        if "next" in which:
+            fixtures = [event for event in events if event.get("status", {}).get("code") == 0]
+            result["next"] = sorted(fixtures, key = lambda x: x["startTimestamp"]) if fixtures else None
+
+        if "last" in which:
+            fixtures = [event for event in events if event.get("status", {}).get("code") == 100]
+            if not fixtures:
+                previous = round - 1 if round > 1 else 1
+                data = await self.api._get(f"/unique-tournament/{self.league_id}/season/{season}/events/round/{previous}")
+                fixtures = [event for event in data.get("events", []) if event.get("status", {}).get("code") == 100]
+            result["last"] = sorted(fixtures, key = lambda x: x["startTimestamp"], reverse = True) if fixtures else None
+
+        return result
+
+    @classmethod
+    async def fixtures_many(cls, api: SofascoreAPI, league_ids: List[int], which: Tuple[str, ...] = ("next", "last")) -> Dict[int, Dict[str, Any]]:
+        """
+        Fetch the next and/or last fixtures of many leagues concurrently.
 
-        fixtures = [event for event in data.get("events", []) if event.get("status", {}).get("code") == 100]
+        Each league resolves its current season and round (see ``next_fixtures``) and fetches the round's
+        events once for both lists, with all leagues running at the same time. A league that fails does not
+        affect the others; its entry holds the error instead.
 
-        if fixtures:
-            return sorted(fixtures, key = lambda x: x["startTimestamp"], reverse = True)
-        
-        round = round_obj - 1 if round_obj > 1 else 1
+        Args:
+            api (SofascoreAPI): An instance of the SofascoreAPI class.
+            league_ids (List[int]): The unique IDs of the leagues.
+            which (Tuple[str, ...], optional): Which lists to return, "next" and/or "last". Defaults to both.
 
-        data = await self.api._get(f"/unique-tournament/{self.league_id}/season/{season}/events/round/{round}")
-        last_fixtures = [event for event in data.get("events", []) if event.get("status", {}).get("code") == 100]
-        fixtures = sorted(last_fixtures, key = lambda x: x["startTimestamp"], reverse = True)
+        Returns:
+            Dict[int, Dict[str, Any]]: For each league ID, the "next" and "last" fixtures as returned by
+                ``next_fixtures`` and ``last_fixtures``, or an "error" key holding the exception if the league failed.
 
-        return fixtures if fixtures else None
+        Raises:
+            ValueError: If ``which`` contains anything other than "next" and "last".
+
+        Example Response:
+            .. code-block:: python
+            {
+                17: {
+                    "next": [{"id": 12436870, ...}],
+                    "last": [{"id": 12436861, ...}]
+                },
+                8: {
+                    "error": SofascoreAPIError("Failed to fetch /unique-tournament/8/seasons: 403")
+                }
+            }
+        """
+        for name in which:
+            if name not in ("next", "last"):
+                raise ValueError(f"Invalid fixtures: {name}. Must be one of ['next', 'last']")
+
+        league_ids = list(dict.fromkeys(league_ids))
+        results = await asyncio.gather(
+            *(cls(api, league_id)._current_fixtures(tuple(which)) for league_id in league_ids),
+            return_exceptions = True
+        )
+        return {
+            league_id: {"error": result} if isinstance(result, Exception) else result
+            for league_id, result in zip(league_ids, results)
+        }
     
     async def cup_tree(self, season_id: int) -> Dict[str, Any]:
         """
@@ -1789,6 +2087,83 @@ class League:
         """
         return await self.api._get(f"/unique-tournament/{self.league_id}/season/{season_id}/cuptrees")
     
+    async def cup_bracket(self, season_id: int) -> Dict[str, Any]:
+        """
+        Walks the cup tree of a season and attaches the matches of every tie, fetching all events concurrently.
+
+        Each tie (block) is linked to the ties its participants came from and to the tie its winner goes to,
+        using the participants' ``sourceBlockId`` or, when missing, their team in the previous round. Events of
+        finished ties no longer change and are kept for the lifetime of the API client, so rebuilding a bracket
+        only fetches the events of ties that are still open.
+
+        Args:
+            season_id (int): The ID of the season.
+
+        Returns:
+            Dict[str, Any]: A dictionary containing:
+                - trees (List[Dict[str, Any]]): One entry per cup tree with its "id", "name", "currentRound"
+                  and "rounds", each round listing the block IDs of its ties in order.
+                - blocks (Dict[int, Dict[str, Any]]): Every tie keyed by block ID: the block from ``cup_tree``
+                  plus "round" (the round order), "matches" (the event objects), "previous" (block IDs) and
+                  "next" (block ID or None).
+
+        Raises:
+            Exception: If the API request fails.
+
+        Example Response:
+            .. code-block:: python
+            {
+                "trees": [
+                    {"id": 10569462, "name": "FA Cup 24/25", "currentRound": 4, "rounds": [{"order": 1, "description": "Round 1", "blocks": [2253397]}]}
+                ],
+                "blocks": {
+                    2253397: {"blockId": 2253397, "finished": true, "round": 1, "matches": [{"id": 12633042, ...}], "previous": [], "next": 2253551}
+                }
+            }
+        """
+        data = await self.cup_tree(season_id)
+        trees = []
+        blocks = {}
+
+        for tree in data.get("cupTrees", []):
+            rounds = []
+            previous_round = []
+            for round in sorted(tree.get("rounds", []), key = lambda x: x.get("order", 0)):
+                block_ids = []
+                for block in round.get("blocks", []):
+                    node = dict(block, round = round.get("order"), matches = [], previous = [], next = None)
+                    blocks[block["blockId"]] = node
+                    block_ids.append(block["blockId"])
+
+                    for participant in block.get("participants", []):
+                        source = participant.get("sourceBlockId")
+                        if source not in blocks:
+                            team_id = participant.get("team", {}).get("id")
+                            source = next((
+                                candidate for candidate in previous_round
+                                if team_id in [entry.get("team", {}).get("id") for entry in blocks[candidate].get("participants", [])]
+                            ), None)
+                        if source is not None and source not in node["previous"]:
+                            node["previous"].append(source)
+                            blocks[source]["next"] = block["blockId"]
+
+                rounds.append({"order": round.get("order"), "description": round.get("description"), "blocks": block_ids})
+                previous_round = block_ids
+
+            trees.append({"id": tree.get("id"), "name": tree.get("name"), "currentRound": tree.get("currentRound"), "rounds": rounds})
+
+        async def fetch(event_id, finished):
+            endpoint = f"/event/{event_id}"
+            data = await (self.api._get_cached(endpoint) if finished else self.api._get(endpoint))
+            return data.get("event", data)
+
+        requests = [(node, event_id) for node in blocks.values() for event_id in node.get("events", [])]
+        events = await asyncio.gather(*(fetch(event_id, node.get("finished")) for node, event_id in requests))
+        for (node, _), event in zip(requests, events):
+            node["matches"].append(event)
+
+        return {"trees": trees, "blocks": blocks}
+
     async def cup_fixtures_per_round(self, season_id: int, round_id: int) -> Dict[Dict, Any]:
         """
         Fetch the next fixtures for the given season and round.
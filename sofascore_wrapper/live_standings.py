@@ -0,0 +1,108 @@
+from .api import SofascoreAPI
+from .league import League
+from .match import Match
+from .standings import StandingsEngine, StandingsTable
+from typing import Dict, Any
+
+PLAYED_TYPES = ("inprogress", "finished")
+
+class LiveStandings:
+    def __init__(self, api: SofascoreAPI, league_id: int, season: int):
+        """
+        Projects an "as it stands" table from the standings and the scores of the league's live matches.
+
+        The standings are downloaded once by ``start``. After that only ``Match.live_games`` is polled, one
+        request for every live football match, and the scores of this league's matches are applied to a
+        ``StandingsEngine``. A match that drops out of the live list keeps its last applied score, so the
+        table stays correct after full time without fetching the standings again. Requires NumPy.
+
+        A finished event is only applied if it was seen in progress since ``start``: matches that finished
+        earlier are already counted in the downloaded standings.
+
+        Args:
+            api (SofascoreAPI): An instance of the SofascoreAPI class.
+            league_id (int): The unique ID of the league.
+            season (int): The season ID.
+        """
+        self.api = api
+        self.league_id = league_id
+        self.season = season
+        self.engine = None
+        self._table = None
+        self._live = set()
+
+    def _belongs(self, event: Dict[str, Any]) -> bool:
+        return (
+            event.get("tournament", {}).get("uniqueTournament", {}).get("id") == self.league_id
+            and event.get("season", {}).get("id") == self.season
+        )
+
+    async def start(self) -> StandingsTable:
+        """
+        Downloads the standings and the current live scores and returns the projected table.
+
+        Raises:
+            Exception: If the API request fails.
+        """
+        standings = await League(self.api, self.league_id).standings(self.season)
+        self.engine = StandingsEngine(StandingsTable.from_standings(standings))
+        self._table = None
+        self._live = set()
+        await self.refresh()
+        return self.table()
+
+    def update(self, event: Dict[str, Any]) -> bool:
+        """
+        Applies the score of one event, e.g. from ``Match.get_match`` or a ``MatchScheduler``.
+
+        Only events in progress, or finished after being seen in progress since ``start``, are applied.
+        Events of other leagues or seasons, events that have not started or were postponed, canceled or
+        otherwise not played, and events that had already finished before ``start`` are ignored.
+
+        Returns:
+            bool: True if the projected table changed.
+
+        Raises:
+            RuntimeError: If ``start`` has not been awaited yet.
+        """
+        if self.engine is None:
+            raise RuntimeError("LiveStandings.start() must be awaited before applying events")
+
+        event = event.get("event", event)
+        status = event.get("status", {}).get("type")
+        if not self._belongs(event) or status not in PLAYED_TYPES:
+            return False
+        if status == "inprogress":
+            self._live.add(event.get("id"))
+        elif event.get("id") not in self._live:
+            # Already part of the downloaded standings
+            return False
+
+        changed = self.engine.apply(event)
+        if changed:
+            self._table = None
+        return changed
+
+    async def refresh(self) -> bool:
+        """
+        Fetches the live football matches once and applies the scores of this league's matches.
+
+        Returns:
+            bool: True if the projected table changed.
+
+        Raises:
+            Exception: If the API request fails.
+        """
+        data = await Match(self.api).live_games()
+        changed = False
+        for event in data.get("events", []):
+            changed = self.update(event) or changed
+        return changed
+
+    def table(self) -> StandingsTable:
+        """
+        Returns the projected table. It is only re-ranked after a score has changed.
+        """
+        if self._table is None:
+            self._table = self.engine.table()
+        return self._table
@@ -1,9 +1,19 @@
-from .api import SofascoreAPI
+from .api import SofascoreAPI, gather_not_found
+import asyncio
 import datetime
-from typing import Optional, Dict, Any
+from collections import deque
+from typing import Optional, Dict, Any, AsyncIterator, Iterable, Tuple
 from pathlib import Path
 import json
 
+DEFAULT_SNAPSHOT_PARTS = (
+    "get_match", "stats", "lineups_home", "lineups_away", "incidents", "managers", "h2h",
+    "votes", "pre_match_form", "shotmap", "best_home_players", "match_odds", "team_streaks"
+)
+SNAPSHOT_PARTS = DEFAULT_SNAPSHOT_PARTS + (
+    "best_away_players", "motm", "match_channels", "highlight", "commentary", "featured_odds", "win_probability"
+)
+
 class Match:
     ENUMS_PATH = Path(__file__).parent / "tools" / "enums.json"
 
@@ -695,81 +705,6 @@ class Match:
         """
         return await self.api._get(f"/event/{self.match_id}/h2h")
     
-    async def incidents(self):
-        """
-        Retrieves important incidents during the match, including game status changes.
-
-        This function returns a list of incidents that occurred in the match, such as 
-        goals, substitutions, or other significant game events. Each incident contains 
-        details such as the time, player involved (if applicable), description, and 
-        game status (e.g., score updates, penalties).
-
-        :returns: A dictionary containing a list of incidents with details about each 
-                incident, including time, player, description, and the type of incident.
-        :rtype: dict
-
-        Example Response:
-            .. code-block:: json
-
-                {
-                    "incidents": [
-                        {
-                            "text": "FT",
-                            "homeScore": 1,
-                            "awayScore": 2,
-                            "isLive": false,
-                            "time": 90,
-                            "addedTime": 999,
-                            "timeSeconds": 5400,
-                            "reversedPeriodTime": 1,
-                            "reversedPeriodTimeSeconds": 0,
-                            "incidentType": "period"
-                        },
-                        {
-                            "time": 90,
-                            "player": {
-                                "name": "Raheem Sterling",
-                                "slug": "raheem-sterling",
-                                "shortName": "R. Sterling",
-                                "position": "M",
-                                "jerseyNumber": "30",
-                                "height": 170,
-                                "userCount": 49508,
-                                "id": 138534,
-                                "marketValueCurrency": "EUR",
-                                "dateOfBirthTimestamp": 786844800,
-                                "proposedMarketValueRaw": {
-                                    "value": 21000000,
-                                    "currency": "EUR"
-                                },
-                                "fieldTranslations": {
-                                    "nameTranslation": {
-                                        "ar": "رحيم ستيرلينغ",
-                                        "hi": "रहीम स्टर्लिंग",
-                                        "bn": "রাহিম স্টার্লিং"
-                                    },
-                                    "shortNameTranslation": {
-                                        "ar": "ر. سترلينغ",
-                                        "hi": "आर. स्टर्लिंग",
-                                        "bn": "আর. স্টার্লিং"
-                                    }
-                                }
-                            },
-                            "description": "Goalkeeper save",
-                            "id": 118513874,
-                            "addedTime": 3,
-                            "incidentType": "inGamePenalty",
-                            "isHome": false,
-                            "incidentClass": "missed",
-                            "reason": "goalkeeperSave",
-                            "reversedPeriodTime": 1
-                        }
-                    ]
-                }
-        """
-        return await self.api._get(f"/event/{self.match_id}/incidents")
-
-    
     async def incidents(self) -> Dict[str, Any]:
         """
         Fetches the important incidents for the specified match, including game status changes and key events.
@@ -870,6 +805,69 @@ class Match:
             Exception: If the API request fails or returns an error.
         """
         return await self.api._get(f"/event/{self.match_id}/incidents")
+
+    @staticmethod
+    def _incident_key(incident: Dict[str, Any]) -> Any:
+        if "id" in incident:
+            return incident["id"]
+        return (incident.get("incidentType"), incident.get("text"), incident.get("time"), incident.get("addedTime"))
+
+    @staticmethod
+    def _incident_fingerprint(incident: Dict[str, Any]) -> int:
+        return hash((
+            incident.get("incidentType"),
+            incident.get("incidentClass"),
+            incident.get("time"),
+            incident.get("addedTime"),
+            incident.get("player", {}).get("id"),
+            incident.get("assist1", {}).get("id"),
+            incident.get("homeScore"),
+            incident.get("awayScore"),
+            incident.get("rescinded"),
+            incident.get("reason")
+        ))
+
+    async def stream_incidents(self, budget: float = 1.0) -> AsyncIterator[Tuple[str, Dict[str, Any]]]:
+        """
+        Polls the match incidents and yields only incidents that are new or have been amended since the last poll.
+
+        Incidents are polled at an adaptive interval (see ``MatchScheduler``) until the match has finished.
+        Each incident is remembered by its ``id`` (or its type, text and time for status incidents without one)
+        together with a hash of its type, class, time, player, assist and score. When a later poll returns the
+        same incident with a different hash, e.g. a goal credited to another player or a yellow card upgraded to
+        a red, it is yielded again as an update.
+
+        Args:
+            budget (float, optional): The maximum number of requests per second. Defaults to 1.0.
+
+        Returns:
+            AsyncIterator[Tuple[str, Dict[str, Any]]]: Tuples of ("new" or "updated", incident), oldest first within each poll.
+
+        Example Usage:
+            .. code-block:: python
+
+                async for change, incident in match.stream_incidents():
+                    print(change, incident["incidentType"], incident.get("time"))
+        """
+        from .scheduler import MatchScheduler
+
+        scheduler = MatchScheduler(self.api, budget = budget, resources = ("incidents",))
+        scheduler.add(self.match_id)
+        seen = {}
+
+        async for _, resource, data in scheduler.run():
+            if resource != "incidents":
+                continue
+
+            for incident in reversed(data.get("incidents", [])):
+                key = self._incident_key(incident)
+                fingerprint = self._incident_fingerprint(incident)
+                previous = seen.get(key)
+                if previous == fingerprint:
+                    continue
+
+                seen[key] = fingerprint
+                yield ("new" if previous is None else "updated", incident)
     
     async def best_away_players(self) -> Optional[List[Dict[str, Any]]]:
         """
@@ -1871,6 +1869,65 @@ class Match:
                 - ``fieldTranslations``: Translations for the player's name and short name in different languages.
             """
         return await self.api._get(f"/event/{self.match_id}/comments")
+
+    async def follow_commentary(self, scheduler = None, window: int = 50, budget: float = 1.0) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Polls the match commentary and yields only comments newer than the last one seen.
+
+        Comments are returned newest first by the API, so each poll is scanned only until a comment that was
+        already yielded is reached. Ids do not always grow with time, so the ids of the last ``window`` comments
+        yielded are kept rather than compared by value. The first poll yields at most ``window`` of the most
+        recent comments rather than the whole history. Polling is adaptive (see ``MatchScheduler``) and ends
+        once the match has finished.
+
+        Args:
+            scheduler (MatchScheduler, optional): A scheduler shared by many followers, so every match is polled
+                from one loop under one budget. The caller is responsible for running ``scheduler.serve()``.
+                Defaults to a private scheduler for this match.
+            window (int, optional): The maximum number of past comments yielded on the first poll. Defaults to 50.
+            budget (float, optional): The maximum number of requests per second of the private scheduler. Defaults to 1.0.
+
+        Returns:
+            AsyncIterator[Dict[str, Any]]: The new comment objects, oldest first.
+
+        Example Usage:
+            .. code-block:: python
+
+                async for comment in match.follow_commentary():
+                    print(comment["time"], comment["text"])
+        """
+        from .scheduler import MatchScheduler
+
+        serving = None
+        if scheduler is None:
+            scheduler = MatchScheduler(self.api, budget = budget, resources = ("commentary",))
+            queue = scheduler.subscribe(self.match_id, "commentary")
+            serving = asyncio.ensure_future(scheduler.serve())
+        else:
+            queue = scheduler.subscribe(self.match_id, "commentary")
+
+        recent = deque(maxlen = max(1, window))
+        try:
+            while True:
+                data = await queue.get()
+                if data is None:
+                    return
+
+                new_comments = []
+                for comment in data.get("comments", []):
+                    if comment["id"] in recent:
+                        break
+                    new_comments.append(comment)
+                    if not recent and len(new_comments) >= window:
+                        break
+
+                for comment in reversed(new_comments):
+                    recent.append(comment["id"])
+                    yield comment
+        finally:
+            scheduler.unsubscribe(self.match_id, queue)
+            if serving is not None:
+                serving.cancel()
     
     async def team_streaks(self) -> Dict[str, int]:
         """
@@ -1903,3 +1960,49 @@ class Match:
         return await self.api._get(f"/event/{self.match_id}/graph/win-probability")
     
     
+
+    async def snapshot(self, include: Iterable[str] = DEFAULT_SNAPSHOT_PARTS) -> Dict[str, Any]:
+        """
+        Fetches several per-match resources concurrently and returns them in one dictionary.
+
+        Resources that read the same endpoint, such as ``lineups_home`` and ``lineups_away`` or the best
+        players, share a single request. A resource the API has no data for (404) is returned as None and
+        listed under "errors" instead of failing the whole snapshot.
+
+        Args:
+            include (Iterable[str], optional): The names of the ``Match`` methods to fetch. Defaults to get_match,
+                stats, lineups_home, lineups_away, incidents, managers, h2h, votes, pre_match_form, shotmap,
+                best_home_players, match_odds and team_streaks.
+
+        Returns:
+            Dict[str, Any]: One key per included resource holding its response, plus "errors" mapping the
+                resources that returned 404 to their status code.
+
+        Raises:
+            ValueError: If an included name is not one of ``SNAPSHOT_PARTS``.
+            Exception: If a request fails with a status other than 404.
+
+        Example Response:
+            .. code-block:: json
+            {
+                "get_match": {"event": {...}},
+                "stats": {"statistics": [...]},
+                "votes": null,
+                "errors": {
+                    "votes": 404
+                }
+            }
+        """
+        include = list(dict.fromkeys(include))
+        for name in include:
+            if name not in SNAPSHOT_PARTS:
+                raise ValueError(f"Invalid part: {name}. Must be one of {list(SNAPSHOT_PARTS)}")
+
+        results = await gather_not_found(*(getattr(self, name)() for name in include))
+
+        snapshot = {"errors": {}}
+        for name, (result, status) in zip(include, results):
+            snapshot[name] = result
+            if status is not None:
+                snapshot["errors"][name] = status
+        return snapshot
@@ -0,0 +1,180 @@
+from .api import SofascoreAPI, SofascoreAPIError
+from .match import Match
+from typing import Dict, List, Any, Iterable, Tuple
+from array import array
+from functools import lru_cache
+import asyncio
+import time
+
+@lru_cache(maxsize = 4096)
+def fractional_to_decimal(value: str) -> float:
+    """
+    Converts fractional odds as returned by the API to decimal odds.
+
+    Args:
+        value (str): The fractional odds, e.g. "9/2".
+
+    Returns:
+        float: The decimal odds, e.g. 5.5.
+    """
+    numerator, _, denominator = value.partition("/")
+    return 1 + float(numerator) / float(denominator or 1)
+
+class OddsTracker:
+    def __init__(self, api: SofascoreAPI):
+        """
+        Records the price history of every market choice for many matches and reports the prices that moved.
+
+        Prices are stored per (match, market, choice group, choice) as three ``array('d')`` columns:
+        unix timestamp, decimal odds and implied probability. A point is only appended when the price
+        differs from the previous one, so a choice whose price never moves costs a single point no matter
+        how often it is polled.
+
+        The tracker can poll by itself with ``poll``/``poll_many``, or be fed payloads from a
+        ``MatchScheduler`` polling the "match_odds" resource through ``update``. The latest error of each
+        match that ``poll_many`` could not fetch is kept in ``errors``.
+
+        Args:
+            api (SofascoreAPI): An instance of the SofascoreAPI class.
+        """
+        self.api = api
+        self.series = {}
+        self.errors = {}
+
+    def update(self, match_id: int, data: Dict[str, Any], timestamp: float = None) -> List[Dict[str, Any]]:
+        """
+        Records an odds payload and returns the choices whose price moved since they were last seen.
+
+        Args:
+            match_id (int): The ID of the match the payload belongs to.
+            data (Dict[str, Any]): A payload from ``Match.match_odds`` or ``Match.featured_odds``.
+            timestamp (float, optional): When the payload was observed. Defaults to ``time.time()``.
+
+        Returns:
+            List[Dict[str, Any]]: One entry per moved choice. Choices seen for the first time are recorded but not returned.
+
+        Example Response:
+            .. code-block:: json
+            [
+                {
+                    "match_id": 12436870,
+                    "market": "Full time",
+                    "choice_group": null,
+                    "choice": "1",
+                    "previous": 5.5,
+                    "decimal": 5.25,
+                    "probability": 0.1905
+                }
+            ]
+        """
+        timestamp = time.time() if timestamp is None else timestamp
+        match_series = self.series.setdefault(match_id, {})
+
+        if "featured" in data:
+            markets = [market for market in data["featured"].values() if market]
+        else:
+            markets = data.get("markets", [])
+
+        changes = []
+        for market in markets:
+            for choice in market.get("choices", []):
+                if not choice.get("fractionalValue"):
+                    continue
+
+                key = (market.get("marketName"), market.get("choiceGroup"), choice.get("name"))
+                decimal = fractional_to_decimal(choice["fractionalValue"])
+                columns = match_series.get(key)
+
+                if columns is None:
+                    columns = match_series[key] = {
+                        "timestamp": array("d"),
+                        "decimal": array("d"),
+                        "probability": array("d")
+                    }
+                elif columns["decimal"][-1] == decimal:
+                    continue
+                else:
+                    changes.append({
+                        "match_id": match_id,
+                        "market": key[0],
+                        "choice_group": key[1],
+                        "choice": key[2],
+                        "previous": columns["decimal"][-1],
+                        "decimal": decimal,
+                        "probability": 1 / decimal
+                    })
+
+                columns["timestamp"].append(timestamp)
+                columns["decimal"].append(decimal)
+                columns["probability"].append(1 / decimal)
+
+        return changes
+
+    async def poll(self, match_id: int, featured: bool = False) -> List[Dict[str, Any]]:
+        """
+        Fetches the current odds of a match and records them with ``update``.
+
+        Args:
+            match_id (int): The ID of the match.
+            featured (bool, optional): Poll ``Match.featured_odds`` instead of all markets. Defaults to False.
+
+        Returns:
+            List[Dict[str, Any]]: The choices whose price moved.
+
+        Raises:
+            Exception: If the API request fails or returns an error.
+        """
+        match = Match(self.api, match_id)
+        data = await (match.featured_odds() if featured else match.match_odds())
+        return self.update(match_id, data)
+
+    async def poll_many(self, match_ids: Iterable[int], featured: bool = False) -> List[Dict[str, Any]]:
+        """
+        Polls several matches concurrently.
+
+        Matches without odds (404) are skipped. Other failures do not stop the remaining matches; the
+        latest error of each match is kept in ``errors``.
+
+        Args:
+            match_ids (Iterable[int]): The IDs of the matches.
+            featured (bool, optional): Poll ``Match.featured_odds`` instead of all markets. Defaults to False.
+
+        Returns:
+            List[Dict[str, Any]]: The choices whose price moved, across all matches.
+        """
+        match_ids = list(dict.fromkeys(match_ids))
+        results = await asyncio.gather(*(self.poll(match_id, featured) for match_id in match_ids), return_exceptions = True)
+
+        changes = []
+        for match_id, result in zip(match_ids, results):
+            if isinstance(result, SofascoreAPIError) and result.status == 404:
+                continue
+            if isinstance(result, BaseException):
+                if not isinstance(result, Exception):
+                    raise result
+                self.errors[match_id] = result
+            else:
+                self.errors.pop(match_id, None)
+                changes.extend(result)
+        return changes
+
+    def history(self, match_id: int, market: str, choice: str, choice_group: str = None) -> Dict[str, array]:
+        """
+        Returns the recorded price history of one choice.
+
+        Args:
+            match_id (int): The ID of the match.
+            market (str): The market name, e.g. "Full time".
+            choice (str): The choice name, e.g. "X".
+            choice_group (str, optional): The choice group for markets that have one, e.g. "2.5" for "Match goals".
+
+        Returns:
+            Dict[str, array]: The "timestamp", "decimal" and "probability" columns, or an empty dict if the choice was never seen.
+        """
+        return self.series.get(match_id, {}).get((market, choice_group, choice), {})
+
+    def keys(self, match_id: int) -> List[Tuple[str, str, str]]:
+        """
+        Lists the (market, choice_group, choice) keys recorded for a match.
+        """
+        return list(self.series.get(match_id, {}))
@@ -0,0 +1,81 @@
+from .api import SofascoreAPI, SofascoreAPIError
+from typing import Dict, Any, AsyncIterator
+import asyncio
+import hashlib
+
+async def iter_events(
+    api: SofascoreAPI,
+    path: str,
+    direction: str = "last",
+    until: int = None,
+    limit: int = None
+) -> AsyncIterator[Dict[str, Any]]:
+    """
+    Walks the paginated ``{path}/{direction}/{page}`` event lists, e.g. ``/team/42/events/last/0``.
+
+    While the events of one page are being consumed the next page is already requested. Events are
+    yielded most recent first for "last" and soonest first for "next". Iteration stops after the last
+    page, at the first event beyond ``until`` or after ``limit`` events.
+
+    The pages of "last" past the first one only contain finished events and change only when a new event
+    is added to the first page. They are kept in the API client's cache under the first page's event IDs,
+    and reused as long as a fresh first page lists the same events.
+
+    Args:
+        api (SofascoreAPI): An instance of the SofascoreAPI class.
+        path (str): The endpoint without direction and page, e.g. "/team/42/events".
+        direction (str, optional): "last" for past events or "next" for upcoming ones. Defaults to "last".
+        until (int, optional): A unix timestamp. Stop at events starting before it ("last") or after it ("next").
+        limit (int, optional): The maximum number of events to yield.
+
+    Returns:
+        AsyncIterator[Dict[str, Any]]: The event objects.
+
+    Raises:
+        ValueError: If the direction is not "last" or "next".
+        Exception: If the API request fails with a status other than 404.
+    """
+    if direction not in ("last", "next"):
+        raise ValueError(f"Invalid direction: {direction}. Must be one of ['last', 'next']")
+
+    signature = None
+
+    async def fetch(page):
+        endpoint = f"{path}/{direction}/{page}"
+        try:
+            if signature is not None and page > 0:
+                return await api._get_cached(endpoint, key = f"{endpoint}#{signature}")
+            return await api._get(endpoint)
+        except SofascoreAPIError as exc:
+            if exc.status == 404:
+                return {"events": [], "hasNextPage": False}
+            raise
+
+    page = 0
+    count = 0
+    pending = asyncio.ensure_future(fetch(page))
+    try:
+        while pending is not None:
+            data = await pending
+            pending = None
+
+            if page == 0 and direction == "last":
+                ids = ",".join(str(event["id"]) for event in data.get("events", []))
+                signature = hashlib.sha1(ids.encode()).hexdigest()[:16]
+
+            if data.get("hasNextPage"):
+                pending = asyncio.ensure_future(fetch(page + 1))
+
+            events = sorted(data.get("events", []), key = lambda x: x.get("startTimestamp", 0), reverse = direction == "last")
+            for event in events:
+                if until is not None and (event.get("startTimestamp", 0) < until if direction == "last" else event.get("startTimestamp", 0) > until):
+                    return
+                yield event
+                count += 1
+                if limit is not None and count >= limit:
+                    return
+
+            page += 1
+    finally:
+        if pending is not None:
+            pending.cancel()
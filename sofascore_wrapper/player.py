@@ -1,17 +1,36 @@
-from .api import SofascoreAPI
-from typing import Dict, List, Any, Literal
+from .api import SofascoreAPI, RateLimiter, gather_not_found, bounded_map
+from .pagination import iter_events
+from .search import Search
+from .search_index import normalize
+from typing import Dict, List, Any, Literal, Iterable, AsyncIterator, Tuple
+from urllib.parse import quote
+import asyncio
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+PLAYER_PARTS = {
+    "profile": "/player/{}",
+    "attributes": "/player/{}/attribute-overviews",
+    "national_stats": "/player/{}/national-team-statistics",
+    "transfer_history": "/player/{}/transfer-history"
+}
 
 class PlayerSearch:
     def __init__(self, api: SofascoreAPI, query: str):
         """
         Initialize the PlayerSearch class with the API and search query.
 
+        The query is normalized and URL encoded like ``Search``'s, and responses are reused for ``Search.SEARCH_TTL`` seconds.
+
         Args:
             api (SofascoreAPI): An instance of the SofascoreAPI class.
             query (str): The search query string.
         """
         self.api = api
-        self.query = query.lower().replace(" ", "%20")
+        self.query = quote(normalize(query), safe = "")
 
     async def search_player(self) -> Dict[str, Any]:
         """
@@ -173,10 +192,14 @@ class PlayerSearch:
                 ]
             }
         """
-        return await self.api._get(f"/search/players/{self.query}")
+        data = await self.api._get_cached(f"/search/players/{self.query}", Search.SEARCH_TTL)
+        self.api.search_index.add_results(data)
+        return data
 
 
 class Player:
+    PROFILE_TTL = 6 * 60 * 60
+
     def __init__(self, api: SofascoreAPI, player_id: int):
         """
         Initialize the Player class with the API and player ID.
@@ -188,6 +211,96 @@ class Player:
         self.api = api
         self.player_id = player_id
 
+    async def details(self, parts: Iterable[str] = ("profile", "attributes"), ttl: float = None) -> Dict[str, Any]:
+        """
+        Fetches several parts of the player's profile concurrently.
+
+        Responses are kept by the API client for ``ttl`` seconds, so the same player requested again, e.g. by
+        several squads, costs no further requests. A part the API has no data for (404), such as the national
+        team statistics of a player who has never been capped, is returned as None.
+
+        Args:
+            parts (Iterable[str], optional): Any of "profile" (``get_player``), "attributes", "national_stats"
+                and "transfer_history". Defaults to profile and attributes.
+            ttl (float, optional): How long responses are kept, in seconds. Defaults to ``PROFILE_TTL``.
+
+        Returns:
+            Dict[str, Any]: The response of each part, keyed by part name.
+
+        Raises:
+            ValueError: If a part is not one of ``PLAYER_PARTS``.
+            Exception: If a request fails with a status other than 404.
+        """
+        parts = list(dict.fromkeys(parts))
+        for part in parts:
+            if part not in PLAYER_PARTS:
+                raise ValueError(f"Invalid part: {part}. Must be one of {list(PLAYER_PARTS)}")
+
+        results = await gather_not_found(*(
+            self.api._get_cached(PLAYER_PARTS[part].format(self.player_id), self.PROFILE_TTL if ttl is None else ttl) for part in parts
+        ))
+        return {part: result for part, (result, _) in zip(parts, results)}
+
+    @classmethod
+    async def fetch_many(
+        cls,
+        api: SofascoreAPI,
+        player_ids: Iterable[int],
+        parts: Iterable[str] = ("profile", "attributes", "transfer_history"),
+        concurrency: int = 8,
+        ttl: float = None
+    ) -> AsyncIterator[Tuple[int, Dict[str, Any]]]:
+        """
+        Fetches ``details`` for many players with bounded concurrency and yields each as soon as it is ready.
+        Workers pause while ``concurrency`` results are waiting to be consumed, so a slow consumer does not
+        make results pile up in memory.
+
+        Every player is fetched once however often their ID is given, and players fetched within ``ttl`` seconds,
+        by this or an earlier call, are answered from the API client's cache. A player whose requests fail does
+        not stop the others: their result is ``{"error": exception}``.
+
+        Args:
+            api (SofascoreAPI): An instance of the SofascoreAPI class.
+            player_ids (Iterable[int]): The IDs of the players. May be a lazy iterable.
+            parts (Iterable[str], optional): The parts to fetch, see ``details``. Defaults to profile, attributes
+                and transfer_history.
+            concurrency (int, optional): The number of players fetched at the same time. Defaults to 8.
+            ttl (float, optional): How long responses are kept, in seconds. Defaults to ``PROFILE_TTL``.
+
+        Returns:
+            AsyncIterator[Tuple[int, Dict[str, Any]]]: Tuples of (player_id, details) in completion order.
+
+        Raises:
+            ValueError: If a part is not one of ``PLAYER_PARTS``.
+
+        Example Usage:
+            .. code-block:: python
+
+                async for player_id, details in Player.fetch_many(api, player_ids, concurrency = 16):
+                    if "error" in details:
+                        failed.append(player_id)
+                    else:
+                        save(player_id, details)
+        """
+        parts = list(dict.fromkeys(parts))
+        for part in parts:
+            if part not in PLAYER_PARTS:
+                raise ValueError(f"Invalid part: {part}. Must be one of {list(PLAYER_PARTS)}")
+
+        def pending():
+            seen = set()
+            for player_id in player_ids:
+                if player_id not in seen:
+                    seen.add(player_id)
+                    yield player_id
+
+        results = bounded_map(pending(), lambda player_id: cls(api, player_id).details(parts, ttl), concurrency)
+        try:
+            async for player_id, details, error in results:
+                yield player_id, {"error": error} if error is not None else details
+        finally:
+            await results.aclose()
+
     async def get_player(self) -> Dict[str, Any]:
         """
         Fetch detailed information about the player.
@@ -716,6 +829,96 @@ class Player:
         data["events"].reverse()  # Reverse the list to ensure the most recent match is first
         return data["events"]
 
+    async def iter_events(self, until: int = None, limit: int = None) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Iterates over all of the player's past events, most recent first, page by page.
+
+        Unlike ``last_fixtures``, which only returns the first page, this walks every page while requesting
+        the next one in the background. Pages that can no longer change are kept in the API client's cache and
+        not requested again as long as the player has not played a new match.
+
+        Args:
+            until (int, optional): A unix timestamp. Stop at the first event starting before it.
+            limit (int, optional): The maximum number of events to return.
+
+        Returns:
+            AsyncIterator[Dict[str, Any]]: The event objects, in the same format as ``last_fixtures``.
+
+        Raises:
+            Exception: If the API request fails.
+
+        Example Usage:
+            .. code-block:: python
+
+                season_start = 1723248000
+                async for event in player.iter_events(until = season_start):
+                    print(event["homeTeam"]["name"], event["awayTeam"]["name"])
+        """
+        async for event in iter_events(self.api, f"/player/{self.player_id}/events", "last", until, limit):
+            yield event
+
+    @classmethod
+    async def iter_events_many(
+        cls,
+        api: SofascoreAPI,
+        player_ids: Iterable[int],
+        until: int = None,
+        limit: int = None,
+        concurrency: int = 16
+    ) -> AsyncIterator[Tuple[int, Dict[str, Any]]]:
+        """
+        Iterates over the past events of many players at once, taking turns between them.
+
+        Up to ``concurrency`` players are walked at the same time, each with at most one event requested at a
+        time. Events are yielded as soon as they are ready, in player order when several are, so a player
+        waiting for their next page does not hold up the others. When a player's history is exhausted, or their
+        requests fail, the next player takes their place.
+
+        Args:
+            api (SofascoreAPI): An instance of the SofascoreAPI class.
+            player_ids (Iterable[int]): The IDs of the players. Duplicates are skipped.
+            until (int, optional): A unix timestamp. Stop each player at the first event starting before it.
+            limit (int, optional): The maximum number of events per player.
+            concurrency (int, optional): The number of players walked at the same time. Defaults to 16.
+
+        Returns:
+            AsyncIterator[Tuple[int, Dict[str, Any]]]: Tuples of (player_id, event). A player whose requests
+                fail is dropped after one final ``(player_id, {"error": exception})``, as in ``fetch_many``.
+        """
+        waiting = iter(dict.fromkeys(player_ids))
+        pending = {}
+
+        def advance(player_id, events):
+            pending[asyncio.ensure_future(events.__anext__())] = (player_id, events)
+
+        try:
+            while True:
+                while len(pending) < max(1, concurrency):
+                    player_id = next(waiting, None)
+                    if player_id is None:
+                        break
+                    advance(player_id, cls(api, player_id).iter_events(until, limit))
+                if not pending:
+                    return
+
+                done, _ = await asyncio.wait(pending, return_when = asyncio.FIRST_COMPLETED)
+                for task in [task for task in pending if task in done]:
+                    player_id, events = pending.pop(task)
+                    error = task.exception()
+                    if isinstance(error, StopAsyncIteration):
+                        continue
+                    if error is not None:
+                        yield player_id, {"error": error}
+                        continue
+                    advance(player_id, events)
+                    yield player_id, task.result()
+        finally:
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions = True)
+            for _, events in pending.values():
+                await events.aclose()
+
     async def attributes(self) -> Dict[str, Any]:
         """
         Fetch the player's attributes and performance overview.
@@ -1022,3 +1225,83 @@ class Player:
         """
         return await self.api._get(f"/player/{player_id}/unique-tournaments")
 
+    async def career(self, rate: float = 10.0) -> Dict[str, Any]:
+        """
+        Builds the player's career table from ``league_stats`` of every league and season in ``player_seasons``.
+
+        The statistics of all seasons are requested concurrently, each request waiting for the rate limit.
+        Every season but the most recent one of each league is finished, so its statistics are kept by the API
+        client for its lifetime and only current seasons are requested again. Requires NumPy, install it with
+        ``pip install sofascore-wrapper[numpy]``.
+
+        Args:
+            rate (float, optional): The maximum number of requests started per second. Defaults to 10.0.
+
+        Returns:
+            Dict[str, Any]: "seasons", one dictionary per row with the league and season IDs and names; "stats",
+                the statistic names of the columns; and "matrix", a float NumPy array of shape (seasons, stats)
+                where statistics missing from a season are NaN. Seasons without statistics (404) are NaN rows
+                and listed under "errors".
+
+        Raises:
+            ImportError: If NumPy is not installed.
+            Exception: If a request fails with a status other than 404.
+
+        Example Response:
+            .. code-block:: json
+            {
+                "seasons": [
+                    {"league_id": 17, "league": "Premier League", "season_id": 61627, "year": "24/25", "current": true}
+                ],
+                "stats": ["rating", "totalRating", "countRating", "goals", ...],
+                "matrix": [[6.9, 34.5, 5.0, 0.0, ...]],
+                "errors": {}
+            }
+        """
+        if np is None:
+            raise ImportError("Player.career requires numpy. Install it with: pip install sofascore-wrapper[numpy]")
+
+        seasons = []
+        for entry in (await self.player_seasons(self.player_id)).get("uniqueTournamentSeasons", []):
+            league = entry["uniqueTournament"]
+            for index, season in enumerate(entry.get("seasons", [])):
+                seasons.append({
+                    "league_id": league["id"],
+                    "league": league.get("name"),
+                    "season_id": season["id"],
+                    "year": season.get("year"),
+                    "current": index == 0
+                })
+
+        limiter = RateLimiter(rate)
+
+        async def fetch(season):
+            endpoint = f"/player/{self.player_id}/unique-tournament/{season['league_id']}/season/{season['season_id']}/statistics/overall"
+            await limiter.acquire()
+            if season["current"]:
+                return await self.api._get(endpoint)
+            return await self.api._get_cached(endpoint)
+
+        results = await gather_not_found(*(fetch(season) for season in seasons))
+
+        rows = []
+        errors = {}
+        for season, (result, status) in zip(seasons, results):
+            if status is not None:
+                errors[(season["league_id"], season["season_id"])] = status
+                rows.append({})
+            else:
+                rows.append({
+                    name: value for name, value in result.get("statistics", {}).items()
+                    if name != "id" and isinstance(value, (int, float)) and not isinstance(value, bool)
+                })
+
+        stats = list(dict.fromkeys(name for row in rows for name in row))
+        matrix = np.full((len(rows), len(stats)), np.nan)
+        columns = {name: column for column, name in enumerate(stats)}
+        for index, row in enumerate(rows):
+            for name, value in row.items():
+                matrix[index, columns[name]] = value
+
+        return {"seasons": seasons, "stats": stats, "matrix": matrix, "errors": errors}
+
@@ -0,0 +1,166 @@
+from .api import SofascoreAPI
+from .search import Search
+from .search_index import normalize, entity_sport_id
+from typing import Dict, Any, Iterable, Optional, Tuple, Union
+from difflib import SequenceMatcher
+from pathlib import Path
+import json
+
+SEARCH_KINDS = {"team": "teams", "player": "players", "uniqueTournament": "leagues"}
+
+class EntityResolver:
+    def __init__(
+        self,
+        api: SofascoreAPI,
+        entity_type: str = "team",
+        sport: str = "football",
+        path: str = None,
+        threshold: float = 0.85,
+        rate: float = 10.0
+    ):
+        """
+        Maps names from other data feeds to Sofascore IDs.
+
+        A name is looked up in the confirmed mappings first, then in the client's local ``search_index``, and only the
+        remaining names are searched online with ``Search.many``. Candidates are scored by name
+        similarity (``difflib``), restricted to the sport and adjusted by country when one is given. A best
+        candidate scoring at least ``threshold`` is confirmed, and confirmed mappings are saved to ``path``
+        so the next run over the same feed needs no requests.
+
+        Args:
+            api (SofascoreAPI): An instance of the SofascoreAPI class.
+            entity_type (str, optional): "team", "player" or "uniqueTournament". Defaults to "team".
+            sport (str, optional): The sport of the entities, e.g. "football". Defaults to "football".
+            path (str, optional): A JSON file holding confirmed mappings. Defaults to keeping them in memory only.
+            threshold (float, optional): The minimum score, between 0 and 1, of a confirmed match. Defaults to 0.85.
+            rate (float, optional): The maximum number of searches started per second. Defaults to 10.0.
+
+        Raises:
+            ValueError: If the entity type or the sport is not valid.
+        """
+        if entity_type not in SEARCH_KINDS:
+            raise ValueError(f"Invalid entity type: {entity_type}. Must be one of {list(SEARCH_KINDS)}")
+        self.sport_id = Search._sport_id(sport)
+
+        self.api = api
+        self.entity_type = entity_type
+        self.sport = sport
+        self.path = Path(path) if path else None
+        self.threshold = threshold
+        self.rate = rate
+        self.mappings = {}
+
+        if self.path and self.path.exists():
+            with open(self.path, "r", encoding="utf-8") as file:
+                self.mappings = json.load(file)
+
+    def _key(self, name: str, country: str = None) -> str:
+        return f"{normalize(name)}|{normalize(country) if country else ''}"
+
+    @staticmethod
+    def _country(entity: Dict[str, Any]) -> Dict[str, Any]:
+        return entity.get("country") or (entity.get("team") or {}).get("country") or (entity.get("category") or {})
+
+    def score(self, name: str, entity: Dict[str, Any], country: str = None) -> float:
+        """
+        Scores how well an entity matches a name, from 0 to 1.
+
+        The score is the best ``difflib`` similarity between the name and the entity's name, short name or
+        slug. When a country is given, a matching country (by name, slug or alpha-2 code) adds 0.1 and a
+        different one subtracts 0.2.
+        """
+        query = normalize(name)
+        similarity = max((
+            SequenceMatcher(None, query, normalize(entity[field].replace("-", " ") if field == "slug" else entity[field])).ratio()
+            for field in ("name", "shortName", "slug") if entity.get(field)
+        ), default = 0.0)
+
+        if country:
+            known = {normalize(value) for value in (self._country(entity).get(field) for field in ("name", "slug", "alpha2")) if value}
+            if known:
+                similarity += 0.1 if normalize(country) in known else -0.2
+        return max(0.0, min(1.0, similarity))
+
+    def _best(self, name: str, country: str, entries: Iterable[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+        best = None
+        for entry in entries:
+            entity = entry.get("entity") or {}
+            if entry.get("type") != self.entity_type or "id" not in entity:
+                continue
+            if entity_sport_id(self.entity_type, entity) not in (self.sport_id, None):
+                continue
+            score = self.score(name, entity, country)
+            if best is None or score > best["score"]:
+                best = {"id": entity["id"], "name": entity.get("name"), "score": score}
+        return best
+
+    def confirm(self, name: str, entity_id: int, country: str = None):
+        """
+        Records a mapping, e.g. after checking an unconfirmed candidate by hand. Call ``save`` to persist it.
+        """
+        self.mappings[self._key(name, country)] = entity_id
+
+    def save(self):
+        """
+        Writes the confirmed mappings to ``path``.
+        """
+        if self.path:
+            with open(self.path, "w", encoding="utf-8") as file:
+                json.dump(self.mappings, file, ensure_ascii = False, indent = 1)
+
+    async def resolve_many(self, names: Iterable[Union[str, Tuple[str, str]]]) -> Dict[Any, Optional[Dict[str, Any]]]:
+        """
+        Resolves many names, searching online only for those neither mapped nor found in the local index.
+
+        Args:
+            names (Iterable[Union[str, Tuple[str, str]]]): Names, or (name, country) tuples to also score by country.
+
+        Returns:
+            Dict[Any, Optional[Dict[str, Any]]]: For every name as given: None when nothing was found, otherwise
+                "id", "name", "score", "source" ("mapping", "index" or "search") and "confirmed". Unconfirmed
+                candidates scored below ``threshold`` and are not saved. A failed search has "error" instead.
+
+        Example Usage:
+            .. code-block:: python
+
+                resolver = EntityResolver(api, "team", "football", path = "team_ids.json")
+                resolved = await resolver.resolve_many([("Man Utd", "England"), ("Inter", "Italy")])
+                ids = {name: match["id"] for name, match in resolved.items() if match and match.get("confirmed")}
+        """
+        items = [(item, *((item, None) if isinstance(item, str) else item)) for item in dict.fromkeys(names)]
+        resolved = {}
+        misses = []
+
+        for item, name, country in items:
+            key = self._key(name, country)
+            if key in self.mappings:
+                resolved[item] = {"id": self.mappings[key], "name": name, "score": 1.0, "source": "mapping", "confirmed": True}
+                continue
+
+            best = self._best(name, country, self.api.search_index.query(name, sport = self.sport, types = [self.entity_type]))
+            if best is not None and best["score"] >= self.threshold:
+                resolved[item] = dict(best, source = "index", confirmed = True)
+                self.mappings[key] = best["id"]
+            else:
+                misses.append((item, name, country))
+
+        if misses:
+            results = await Search.many(self.api, [name for _, name, _ in misses], kind = SEARCH_KINDS[self.entity_type], sport = self.sport, rate = self.rate)
+            for item, name, country in misses:
+                result = results[name]
+                if "error" in result:
+                    resolved[item] = {"error": result["error"]}
+                    continue
+
+                best = self._best(name, country, result.get("results", []))
+                if best is None:
+                    resolved[item] = None
+                    continue
+
+                confirmed = best["score"] >= self.threshold
+                resolved[item] = dict(best, source = "search", confirmed = confirmed)
+                if confirmed:
+                    self.mappings[self._key(name, country)] = best["id"]
+
+        self.save()
+        return {item: resolved[item] for item, _, _ in items}
@@ -0,0 +1,320 @@
+from .api import SofascoreAPI, RateLimiter
+from .match import Match
+from typing import Dict, Any, Optional, Iterable, AsyncIterator, Tuple
+import asyncio
+import heapq
+import time
+
+DEFAULT_RESOURCES = ("incidents", "stats", "commentary", "win_probability")
+
+LIVE_INTERVAL = 15
+BREAK_INTERVAL = 60
+KICKOFF_INTERVAL = 30
+PRE_MATCH_INTERVAL = 900
+
+BREAK_CODES = {31, 32, 33, 34}
+FINISHED_CODES = {60, 70, 90, 100, 110, 120}
+FINISHED_TYPES = {"finished", "canceled", "postponed"}
+
+def _offer(queue: asyncio.Queue, item: Any):
+    # Subscriber queues are bounded: when a consumer falls behind, its oldest payload is dropped
+    if queue.full():
+        queue.get_nowait()
+    queue.put_nowait(item)
+
+def poll_interval(event: Dict[str, Any], now: float = None) -> Optional[float]:
+    """
+    Works out how often a match should be polled from its ``status`` and ``startTimestamp``.
+
+    Args:
+        event (Dict[str, Any]): The event object returned by ``Match.get_match``.
+        now (float, optional): The current unix timestamp. Defaults to ``time.time()``.
+
+    Returns:
+        Optional[float]: The poll interval in seconds, or None once the match is over and should no longer be polled.
+
+    Example Response:
+        .. code-block:: python
+
+            poll_interval({"status": {"code": 6, "type": "inprogress"}})   # 15
+            poll_interval({"status": {"code": 31, "type": "inprogress"}})  # 60
+            poll_interval({"status": {"code": 100, "type": "finished"}})   # None
+    """
+    now = time.time() if now is None else now
+    status = event.get("status", {})
+    code = status.get("code")
+
+    if status.get("type") in FINISHED_TYPES or code in FINISHED_CODES:
+        return None
+    if status.get("type") == "inprogress":
+        return BREAK_INTERVAL if code in BREAK_CODES else LIVE_INTERVAL
+    if status.get("type") == "interrupted":
+        return BREAK_INTERVAL
+
+    until_kickoff = event.get("startTimestamp", now) - now
+    return min(PRE_MATCH_INTERVAL, max(KICKOFF_INTERVAL, until_kickoff / 4))
+
+class MatchScheduler:
+    def __init__(self, api: SofascoreAPI, budget: float = 4.0, resources: Iterable[str] = DEFAULT_RESOURCES):
+        """
+        Polls many matches at once, adapting each match's interval to its status and kickoff time.
+
+        Every poll fetches ``Match.get_match`` to refresh the status, followed by the match's resources.
+        Matches are polled quickly while in play, slowly before kick-off and during breaks, and dropped
+        after a final poll once they have finished. When the combined demand exceeds ``budget`` the
+        available requests are shared between matches in proportion to their priority.
+
+        Args:
+            api (SofascoreAPI): An instance of the SofascoreAPI class.
+            budget (float, optional): The maximum number of requests per second across all matches. Defaults to 4.0.
+            resources (Iterable[str], optional): The ``Match`` methods polled for each match. Defaults to
+                incidents, stats, commentary and win_probability.
+
+        Raises:
+            ValueError: If the budget is not positive.
+        """
+        if budget <= 0:
+            raise ValueError(f"Invalid budget: {budget}. Must be greater than 0")
+
+        self.api = api
+        self.budget = budget
+        self.limiter = RateLimiter(budget)
+        self.resources = tuple(resources)
+        self.matches = {}
+        self.errors = {}
+        self._queue = []
+        self._wakeup = None
+        self._subscribers = {}
+
+    def add(self, match_id: int, resources: Iterable[str] = None, priority: float = 1.0):
+        """
+        Starts polling a match. The first poll happens as soon as the budget allows.
+
+        Args:
+            match_id (int): The ID of the match.
+            resources (Iterable[str], optional): The ``Match`` methods to poll. Defaults to the scheduler's resources.
+            priority (float, optional): The match's share of the budget relative to other matches. Defaults to 1.0.
+
+        Raises:
+            ValueError: If a resource is not a ``Match`` method or the priority is not positive.
+        """
+        resources = tuple(resources) if resources is not None else self.resources
+        for name in resources:
+            if not callable(getattr(Match, name, None)):
+                raise ValueError(f"Invalid resource: {name}. Must be a Match method such as {list(DEFAULT_RESOURCES)}")
+        if priority <= 0:
+            raise ValueError(f"Invalid priority: {priority}. Must be greater than 0")
+
+        now = time.monotonic()
+        self.matches[match_id] = {
+            "resources": resources,
+            "priority": priority,
+            "interval": LIVE_INTERVAL,
+            "effective": LIVE_INTERVAL,
+            "event": None,
+            "due": now
+        }
+        heapq.heappush(self._queue, (now, -priority, match_id))
+        self._rebalance()
+        if self._wakeup is not None:
+            self._wakeup.set()
+
+    def remove(self, match_id: int):
+        """
+        Stops polling a match. A poll that is already running is allowed to finish.
+        """
+        if self.matches.pop(match_id, None) is not None:
+            self._rebalance()
+        for key in [key for key in self._subscribers if key[0] == match_id]:
+            for queue in self._subscribers.pop(key):
+                _offer(queue, None)
+
+    def subscribe(self, match_id: int, resource: str, maxsize: int = 2) -> asyncio.Queue:
+        """
+        Registers a queue that receives every new payload of one resource of one match.
+
+        The match is added to the scheduler if it is not already polled, and the resource is added to its
+        resources if missing. None is put on the queue once the match stops being polled. Subscribers only
+        receive data while ``run`` or ``serve`` is driving the scheduler. The queue keeps at most ``maxsize``
+        items: when the consumer falls behind, the oldest payload is dropped, so only the most recent
+        payloads are kept in memory.
+
+        Args:
+            match_id (int): The ID of the match.
+            resource (str): The ``Match`` method whose payloads are wanted, e.g. "commentary".
+            maxsize (int, optional): The number of payloads kept for a slow consumer. At least 2, so the latest
+                payload is not dropped for the final None. Defaults to 2.
+
+        Returns:
+            asyncio.Queue: The queue the payloads are put on.
+        """
+        state = self.matches.get(match_id)
+        if state is None:
+            self.add(match_id, resources = (resource,))
+        elif resource not in state["resources"]:
+            if not callable(getattr(Match, resource, None)):
+                raise ValueError(f"Invalid resource: {resource}. Must be a Match method such as {list(DEFAULT_RESOURCES)}")
+            state["resources"] += (resource,)
+            self._rebalance()
+
+        queue = asyncio.Queue(maxsize = max(2, maxsize))
+        self._subscribers.setdefault((match_id, resource), []).append(queue)
+        return queue
+
+    def unsubscribe(self, match_id: int, queue: asyncio.Queue):
+        """
+        Removes a queue registered with ``subscribe``. The match keeps being polled.
+        """
+        for key in [key for key in self._subscribers if key[0] == match_id]:
+            if queue in self._subscribers[key]:
+                self._subscribers[key].remove(queue)
+            if not self._subscribers[key]:
+                del self._subscribers[key]
+
+    def _rebalance(self):
+        # Weighted max-min fair share: matches that need less than their share keep what they need
+        # and the remainder is split between the others by priority.
+        demand = {
+            match_id: (1 + len(state["resources"])) / state["interval"]
+            for match_id, state in self.matches.items()
+        }
+        remaining = self.budget
+        total_weight = sum(state["priority"] for state in self.matches.values())
+
+        for match_id in sorted(demand, key = lambda x: demand[x] / self.matches[x]["priority"]):
+            state = self.matches[match_id]
+            share = remaining * state["priority"] / total_weight if remaining > 0 and total_weight > 0 else 0
+            rate = min(demand[match_id], share)
+            remaining -= rate
+            total_weight -= state["priority"]
+            # Without any budget left the match falls back to its own interval and waits for the rate limiter
+            state["effective"] = (1 + len(state["resources"])) / rate if rate > 0 else state["interval"]
+
+    async def _poll(self, match_id: int, results: asyncio.Queue):
+        state = self.matches.get(match_id)
+        if state is None:
+            return
+        match = Match(self.api, match_id)
+
+        async def fetch(name):
+            await self.limiter.acquire()
+            try:
+                data = await getattr(match, name)()
+            except Exception as exc:
+                self.errors[(match_id, name)] = exc
+                return None
+            self.errors.pop((match_id, name), None)
+            results.put_nowait((match_id, name, data))
+            for queue in self._subscribers.get((match_id, name), ()):
+                _offer(queue, data)
+            return data
+
+        data = await fetch("get_match")
+        if data is not None:
+            state["event"] = data.get("event", data)
+
+        await asyncio.gather(*(fetch(name) for name in state["resources"]))
+
+        if self.matches.get(match_id) is not state:
+            return
+
+        interval = poll_interval(state["event"]) if state["event"] else BREAK_INTERVAL
+        if interval is None:
+            self.remove(match_id)
+            return
+
+        if interval != state["interval"]:
+            state["interval"] = interval
+            self._rebalance()
+
+        state["due"] = time.monotonic() + state["effective"]
+        heapq.heappush(self._queue, (state["due"], -state["priority"], match_id))
+        self._wakeup.set()
+
+    async def _dispatch(self, results: asyncio.Queue, tasks: set):
+        while self.matches or tasks:
+            self._wakeup.clear()
+            if not self._queue:
+                await self._wakeup.wait()
+                continue
+
+            due, _, match_id = self._queue[0]
+            state = self.matches.get(match_id)
+            if state is None or state["due"] != due:
+                heapq.heappop(self._queue)
+                continue
+
+            delay = due - time.monotonic()
+            if delay > 0:
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), timeout = delay)
+                except asyncio.TimeoutError:
+                    pass
+                continue
+
+            heapq.heappop(self._queue)
+            state["due"] = None
+            task = asyncio.ensure_future(self._poll(match_id, results))
+            tasks.add(task)
+            task.add_done_callback(lambda t: (tasks.discard(t), self._wakeup.set()))
+
+        results.put_nowait(None)
+
+    async def run(self) -> AsyncIterator[Tuple[int, str, Any]]:
+        """
+        Polls the scheduled matches until every one of them has finished or been removed.
+
+        Each successful request is yielded as soon as it completes. Failed requests are not yielded;
+        the latest error for each (match_id, resource) pair is kept in ``errors`` instead.
+
+        Returns:
+            AsyncIterator[Tuple[int, str, Any]]: Tuples of (match_id, resource, data), where resource is the
+                name of the ``Match`` method that produced the data, including "get_match".
+
+        Example Usage:
+            .. code-block:: python
+
+                scheduler = MatchScheduler(api, budget = 5)
+                for match_id in live_ids:
+                    scheduler.add(match_id)
+
+                async for match_id, resource, data in scheduler.run():
+                    print(match_id, resource)
+        """
+        self._wakeup = asyncio.Event()
+        results = asyncio.Queue()
+        tasks = set()
+        dispatcher = asyncio.ensure_future(self._dispatch(results, tasks))
+
+        try:
+            while True:
+                item = await results.get()
+                if item is None:
+                    return
+                yield item
+        finally:
+            dispatcher.cancel()
+            for task in list(tasks):
+                task.cancel()
+            for queues in self._subscribers.values():
+                for queue in queues:
+                    _offer(queue, None)
+            self._subscribers.clear()
+
+    async def serve(self):
+        """
+        Drives the scheduler for its subscribers only, discarding the results ``run`` would yield.
+
+        Example Usage:
+            .. code-block:: python
+
+                scheduler = MatchScheduler(api, budget = 10)
+
+                async def print_commentary(match_id):
+                    async for comment in Match(api, match_id).follow_commentary(scheduler = scheduler):
+                        print(match_id, comment["text"])
+
+                await asyncio.gather(scheduler.serve(), *(print_commentary(match_id) for match_id in live_ids))
+        """
+        async for _ in self.run():
+            pass
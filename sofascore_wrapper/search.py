@@ -1,6 +1,9 @@
-from .api import SofascoreAPI
-from typing import Dict, List, Any
+from .api import SofascoreAPI, SofascoreAPIError, RateLimiter, bounded_map
+from .search_index import normalize, entity_sport_id
+from typing import Dict, List, Any, Iterable
 from pathlib import Path
+from urllib.parse import quote
+import asyncio
 import json
 
 class Search:
@@ -9,30 +12,67 @@ class Search:
     with open(ENUMS_PATH, "r", encoding="utf-8") as file:
         ENUMS = json.load(file)
 
-    def __init__(self, api: SofascoreAPI, search_string: str, page: int = 0):
+    # Seconds a search response is reused for the same normalized query
+    SEARCH_TTL = 10 * 60
+
+    def __init__(self, api: SofascoreAPI, search_string: str, page: int = 0, pages: int = 1):
         """
         Initialize the Search class with the API, search string, and page number.
 
+        The search string is normalized (lowercase, accents stripped, whitespace collapsed) and URL encoded, so
+        "Martin  Ødegaard" and "martin odegaard" share the same cached response for ``SEARCH_TTL`` seconds.
+
         Args:
             api (SofascoreAPI): An instance of the SofascoreAPI class.
             search_string (str): The search query string.
             page (int, optional): The page number for paginated results. Defaults to 0.
+            pages (int, optional): The number of pages, starting at ``page``, to fetch concurrently and merge by score. Defaults to 1.
         """
         self.api = api
-        self.search_string = search_string.lower().replace(" ", "%20")
+        self.query = search_string
+        self.search_string = quote(normalize(search_string), safe = "")
         self.page = page
+        self.pages = max(1, pages)
         self.enums = self.ENUMS
+        self.index = api.search_index
+
+    async def _search(self, kind: str) -> Dict[str, Any]:
+        async def fetch(page):
+            try:
+                return await self.api._get_cached(f"/search/{kind}/?q={self.search_string}&page={page}", self.SEARCH_TTL)
+            except SofascoreAPIError as exc:
+                # Pages past the last one are not found
+                if exc.status == 404 and page > self.page:
+                    return {"results": []}
+                raise
+
+        if self.pages == 1:
+            data = await fetch(self.page)
+        else:
+            responses = await asyncio.gather(*(fetch(page) for page in range(self.page, self.page + self.pages)))
+            merged = {}
+            for response in responses:
+                for entry in response.get("results", []):
+                    merged.setdefault((entry.get("type"), entry.get("entity", {}).get("id")), entry)
+            data = {"results": sorted(merged.values(), key = lambda entry: entry.get("score", 0), reverse = True)}
+
+        self.index.add_results(data)
+        return data
 
     def get_sport_id(self, entry):
-        if entry["type"] == "team":
-            return entry["entity"]["sport"]["id"]
-        elif entry["type"] == "player":
-            return entry["entity"]["team"]["sport"]["id"]
-        elif entry["type"] == "event":
-            return entry["entity"]["tournament"]["category"]["sport"]["id"]
-        elif entry["type"] == "uniqueTournament":
-            return entry["entity"]["category"]["sport"]["id"]
-        return None
+        return entity_sport_id(entry.get("type"), entry.get("entity") or {})
+
+    @classmethod
+    def _sport_id(cls, sport: str):
+        if not sport:
+            return None
+        sport = sport.lower().replace(' ', '-')
+        if sport not in cls.ENUMS["sports"]:
+            raise ValueError(f"Invalid sport: {sport}. Must be one of {list(cls.ENUMS['sports'].keys())}")
+        return cls.ENUMS["sports"][sport]
+
+    def _filter_sport(self, data: Dict[str, Any], sport_id: int) -> Dict[str, Any]:
+        return {"results": [entry for entry in data.get("results", []) if self.get_sport_id(entry) == sport_id]}
 
     async def search_all(self, sport: str = None) -> Dict[str, Any]:
         """
@@ -109,21 +149,41 @@ class Search:
                 ]
             }
         """
-        if sport:
-            if sport.lower().replace(' ', '-') not in self.enums["sports"]:
-                raise ValueError(f"Invalid sport: {sport.lower().replace(' ', '-')}. Must be one of {list(self.enums['sports'].keys())}")
-            
-            data = await self.api._get(f"/search/all/?q={self.search_string}&page={self.page}")
+        sport_id = self._sport_id(sport)
+        data = await self._search("all")
+        return data if sport_id is None else self._filter_sport(data, sport_id)
 
-            to_return = {
-                "results": [
-                    entry for entry in data["results"]
-                    if self.get_sport_id(entry) == self.enums["sports"][sport.lower().replace(' ', '-')]
-                ]
-            }
-            return to_return
+    async def autocomplete(self, sport: str = None, limit: int = 10, min_results: int = 1) -> Dict[str, Any]:
+        """
+        Answers the query from the local ``SearchIndex`` of entities seen before, and only searches online on a miss.
 
-        return await self.api._get(f"/search/all/?q={self.search_string}&page={self.page}")
+        Every response of the ``search_*`` methods (and ``PlayerSearch.search_player``) is added to the client's
+        ``api.search_index``, and other payloads can be added with ``api.search_index.add_payload``. When the
+        index has fewer than ``min_results`` matches, ``search_all`` is called and its results are returned instead.
+
+        Args:
+            sport (str, optional): Only return entities of this sport. Same names as ``search_all``.
+            limit (int, optional): The maximum number of results from the index. Defaults to 10.
+            min_results (int, optional): The number of local matches needed to skip the online search. Defaults to 1.
+
+        Returns:
+            Dict[str, Any]: A dictionary with "results" in the same format as ``search_all``. Results from the
+                index carry the local match score instead of the API's score.
+
+        Raises:
+            ValueError: If the sport is not a valid sport name.
+            Exception: If the API request fails.
+
+        Example Usage:
+            .. code-block:: python
+
+                await Search(api, "arsenal").search_all()
+                results = await Search(api, "arse").autocomplete(sport = "football")  # answered locally
+        """
+        results = self.index.query(self.query, sport = sport, limit = limit)
+        if len(results) >= max(1, min_results):
+            return {"results": results}
+        return await self.search_all(sport)
 
     async def search_match(self, sport: str = None) -> List[Dict[str, Any]]:
         """
@@ -335,21 +395,9 @@ class Search:
                 ...
             ]
         """
-        if sport:
-            if sport.lower().replace(' ', '-') not in self.enums["sports"]:
-                raise ValueError(f"Invalid sport: {sport.lower().replace(' ', '-')}. Must be one of {list(self.enums['sports'].keys())}")
-            
-            data = await self.api._get(f"/search/events/?q={self.search_string}&page={self.page}")
-            
-            to_return = {
-                "results": [
-                    entry for entry in data["results"]
-                    if self.get_sport_id(entry) == self.enums["sports"][sport.lower().replace(' ', '-')]
-                ]
-            }
-            return to_return
-        
-        return await self.api._get(f"/search/events/?q={self.search_string}&page={self.page}")
+        sport_id = self._sport_id(sport)
+        data = await self._search("events")
+        return data if sport_id is None else self._filter_sport(data, sport_id)
 
     async def search_players(self, sport: str = None) -> List[Dict[str, Any]]:
         """
@@ -452,21 +500,9 @@ class Search:
                 ...
             ]
         """
-        if sport:
-            if sport.lower().replace(' ', '-') not in self.enums["sports"]:
-                raise ValueError(f"Invalid sport: {sport.lower().replace(' ', '-')}. Must be one of {list(self.enums['sports'].keys())}")
-            
-            data = await self.api._get(f"/search/player-team-persons/?q={self.search_string}&page={self.page}")
-            
-            to_return = {
-                "results": [
-                    entry for entry in data["results"]
-                    if self.get_sport_id(entry) == self.enums["sports"][sport.lower().replace(' ', '-')]
-                ]
-            }
-            return to_return
-        
-        return await self.api._get(f"/search/player-team-persons/?q={self.search_string}&page={self.page}")
+        sport_id = self._sport_id(sport)
+        data = await self._search("player-team-persons")
+        return data if sport_id is None else self._filter_sport(data, sport_id)
 
     async def search_teams(self, sport: str = None) -> List[Dict[str, Any]]:
         """
@@ -541,21 +577,9 @@ class Search:
                 ...
             ]
         """
-        if sport:
-            if sport.lower().replace(' ', '-') not in self.enums["sports"]:
-                raise ValueError(f"Invalid sport: {sport.lower().replace(' ', '-')}. Must be one of {list(self.enums['sports'].keys())}")
-            
-            data = await self.api._get(f"/search/teams/?q={self.search_string}&page={self.page}")
-            
-            to_return = {
-                "results": [
-                    entry for entry in data["results"]
-                    if self.get_sport_id(entry) == self.enums["sports"][sport.lower().replace(' ', '-')]
-                ]
-            }
-            return to_return
-        
-        return await self.api._get(f"/search/teams/?q={self.search_string}&page={self.page}")
+        sport_id = self._sport_id(sport)
+        data = await self._search("teams")
+        return data if sport_id is None else self._filter_sport(data, sport_id)
 
     async def search_leagues(self, sport: str = None) -> List[Dict[str, Any]]:
         """
@@ -623,18 +647,68 @@ class Search:
                 ...
             ]
         """
-        if sport:
-            if sport.lower().replace(' ', '-') not in self.enums["sports"]:
-                raise ValueError(f"Invalid sport: {sport.lower().replace(' ', '-')}. Must be one of {list(self.enums['sports'].keys())}")
-            
-            data = await self.api._get(f"/search/unique-tournaments/?q={self.search_string}&page={self.page}")
-            
-            to_return = {
-                "results": [
-                    entry for entry in data["results"]
-                    if self.get_sport_id(entry) == self.enums["sports"][sport.lower().replace(' ', '-')]
-                ]
-            }
-            return to_return
-        
-        return await self.api._get(f"/search/unique-tournaments/?q={self.search_string}&page={self.page}")
\ No newline at end of file
+        sport_id = self._sport_id(sport)
+        data = await self._search("unique-tournaments")
+        return data if sport_id is None else self._filter_sport(data, sport_id)
+
+    @classmethod
+    async def many(
+        cls,
+        api: SofascoreAPI,
+        queries: Iterable[str],
+        kind: str = "all",
+        sport: str = None,
+        pages: int = 1,
+        rate: float = 10.0,
+        concurrency: int = 8
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Runs the same kind of search for many queries concurrently, e.g. to map a list of team names to IDs.
+
+        Queries that normalize to the same string are searched once. At most ``concurrency`` searches run at
+        the same time and each waits for the shared rate limit, so thousands of queries do not all wait on the
+        limiter at once. A query whose search fails does not stop the others: its result is ``{"error": exception}``.
+
+        Args:
+            api (SofascoreAPI): An instance of the SofascoreAPI class.
+            queries (Iterable[str]): The search strings.
+            kind (str, optional): "all", "match", "players", "teams" or "leagues", i.e. which ``search_*`` method
+                to call. Defaults to "all".
+            sport (str, optional): Only return results of this sport. Same names as ``search_all``.
+            pages (int, optional): The number of result pages per query. Defaults to 1.
+            rate (float, optional): The maximum number of requests started per second. Defaults to 10.0.
+            concurrency (int, optional): The number of searches run at the same time. Defaults to 8.
+
+        Returns:
+            Dict[str, Dict[str, Any]]: The results of every query, keyed by the query as given.
+
+        Raises:
+            ValueError: If the kind or the sport is not valid.
+
+        Example Usage:
+            .. code-block:: python
+
+                results = await Search.many(api, ["Arsenal", "Man City", "Spurs"], kind = "teams", sport = "football")
+                ids = {name: result["results"][0]["entity"]["id"] for name, result in results.items() if result.get("results")}
+        """
+        kinds = {"all": "search_all", "match": "search_match", "players": "search_players", "teams": "search_teams", "leagues": "search_leagues"}
+        if kind not in kinds:
+            raise ValueError(f"Invalid kind: {kind}. Must be one of {list(kinds)}")
+        cls._sport_id(sport)
+
+        queries = list(dict.fromkeys(queries))
+        searches = {}
+        for query in queries:
+            searches.setdefault(normalize(query), cls(api, query, pages = pages))
+
+        limiter = RateLimiter(rate)
+
+        async def run(search):
+            for _ in range(search.pages):
+                await limiter.acquire()
+            return await getattr(search, kinds[kind])(sport)
+
+        by_key = {}
+        async for key, result, error in bounded_map(searches, lambda key: run(searches[key]), concurrency):
+            by_key[key] = {"error": error} if error is not None else result
+        return {query: by_key[normalize(query)] for query in queries}
@@ -0,0 +1,234 @@
+from typing import Dict, List, Any, Iterable, Optional
+from pathlib import Path
+from collections import OrderedDict
+import json
+import unicodedata
+
+ENTITY_KEYS = {
+    "team": "team",
+    "homeTeam": "team",
+    "awayTeam": "team",
+    "player": "player",
+    "manager": "manager",
+    "uniqueTournament": "uniqueTournament"
+}
+
+def normalize(text: str) -> str:
+    """
+    Lowercases a name, strips accents and collapses whitespace, e.g. " Martin  Ødegaard" -> "martin odegaard".
+    """
+    text = unicodedata.normalize("NFKD", str(text).replace("ø", "o").replace("Ø", "O").replace("ß", "ss"))
+    text = "".join(char for char in text if not unicodedata.combining(char))
+    return " ".join(text.lower().split())
+
+def entity_sport_id(entity_type: str, entity: Dict[str, Any]) -> Optional[int]:
+    """
+    Returns the sport ID of a search entity, or None when the payload does not include it.
+    """
+    if entity_type == "team":
+        sport = entity.get("sport")
+    elif entity_type in ("player", "manager"):
+        sport = entity.get("sport") or (entity.get("team") or {}).get("sport")
+    elif entity_type == "event":
+        sport = ((entity.get("tournament") or {}).get("category") or {}).get("sport")
+    elif entity_type == "uniqueTournament":
+        sport = (entity.get("category") or {}).get("sport")
+    else:
+        sport = None
+    return (sport or {}).get("id")
+
+def _trigrams(text: str) -> set:
+    text = f"  {text} "
+    return {text[index:index + 3] for index in range(len(text) - 2)}
+
+class SearchIndex:
+    ENUMS_PATH = Path(__file__).parent / "tools" / "enums.json"
+
+    with open(ENUMS_PATH, "r", encoding="utf-8") as file:
+        ENUMS = json.load(file)
+
+    def __init__(self, max_prefix: int = 20, max_size: int = 50000):
+        """
+        A local autocomplete index over the teams, players, managers and tournaments the client has seen.
+
+        Entities are added from search results with ``add_results`` or from any other payload with
+        ``add_payload``. Every word of an entity's name, short name and slug is indexed by its prefixes,
+        and the full name by its trigrams, so ``query`` answers both as-you-type prefixes and slightly
+        misspelled names without a request. Every ``SofascoreAPI`` client has its own index, ``search_index``.
+
+        Args:
+            max_prefix (int, optional): The longest prefix indexed per word. Defaults to 20.
+            max_size (int, optional): The maximum number of entities. Once exceeded, the entities added or
+                updated least recently are dropped. Defaults to 50000.
+        """
+        self.enums = self.ENUMS
+        self.max_prefix = max_prefix
+        self.max_size = max(1, max_size)
+        self.entities = OrderedDict()
+        self.sports = {}
+        self._prefixes = {}
+        self._trigrams = {}
+        self._names = {}
+        self._words = {}
+
+    def __len__(self) -> int:
+        return len(self.entities)
+
+    def add(self, entity_type: str, entity: Dict[str, Any]) -> bool:
+        """
+        Adds or updates one entity.
+
+        Args:
+            entity_type (str): One of "team", "player", "manager", "uniqueTournament" or "event".
+            entity (Dict[str, Any]): The entity object, with at least "id" and "name".
+
+        Returns:
+            bool: True if the entity was not in the index yet.
+        """
+        if not isinstance(entity, dict) or "id" not in entity or not entity.get("name"):
+            return False
+
+        key = (entity_type, entity["id"])
+        new = key not in self.entities
+        if not new:
+            entity = {**self.entities[key], **entity}
+            self.entities.move_to_end(key)
+        self.entities[key] = entity
+        sport_id = entity_sport_id(entity_type, entity)
+        if sport_id is not None or new:
+            self.sports[key] = sport_id
+        if not new:
+            return False
+
+        name = normalize(entity["name"])
+        self._names[key] = name
+        words = set(name.split())
+        for field in ("shortName", "slug"):
+            if entity.get(field):
+                words.update(normalize(entity[field].replace("-", " ")).split())
+        self._words[key] = words
+        for word in words:
+            for length in range(1, min(len(word), self.max_prefix) + 1):
+                self._prefixes.setdefault(word[:length], set()).add(key)
+        for trigram in _trigrams(name):
+            self._trigrams.setdefault(trigram, set()).add(key)
+
+        while len(self.entities) > self.max_size:
+            self._remove(next(iter(self.entities)))
+        return True
+
+    def _remove(self, key: tuple):
+        del self.entities[key]
+        self.sports.pop(key, None)
+        for word in self._words.pop(key):
+            for length in range(1, min(len(word), self.max_prefix) + 1):
+                self._discard(self._prefixes, word[:length], key)
+        for trigram in _trigrams(self._names.pop(key)):
+            self._discard(self._trigrams, trigram, key)
+
+    @staticmethod
+    def _discard(index: Dict[str, set], token: str, key: tuple):
+        keys = index.get(token)
+        if keys is not None:
+            keys.discard(key)
+            if not keys:
+                del index[token]
+
+    def clear(self):
+        """
+        Drops every entity from the index.
+        """
+        for store in (self.entities, self.sports, self._prefixes, self._trigrams, self._names, self._words):
+            store.clear()
+
+    def add_results(self, data: Dict[str, Any]) -> int:
+        """
+        Adds the entities of a search response, such as ``Search.search_all`` or ``PlayerSearch.search_player``.
+
+        Returns:
+            int: The number of entities that were new to the index.
+        """
+        added = 0
+        for entry in data.get("results", []):
+            added += self.add(entry.get("type"), entry.get("entity"))
+        for player in data.get("players", []):
+            added += self.add("player", player)
+        return added
+
+    def add_payload(self, data: Any) -> int:
+        """
+        Adds every team, player, manager and unique tournament found anywhere in a payload, e.g. the response
+        of ``Match.get_match`` or ``Team.squad``.
+
+        Returns:
+            int: The number of entities that were new to the index.
+        """
+        added = 0
+        stack = [data]
+        while stack:
+            value = stack.pop()
+            if isinstance(value, dict):
+                for field, child in value.items():
+                    if field in ENTITY_KEYS and isinstance(child, dict):
+                        added += self.add(ENTITY_KEYS[field], child)
+                    stack.append(child)
+            elif isinstance(value, list):
+                stack.extend(value)
+        return added
+
+    def query(self, text: str, sport: str = None, types: Iterable[str] = None, limit: int = 10) -> List[Dict[str, Any]]:
+        """
+        Looks up entities whose words start with the words of ``text``, or whose name is similar to it.
+
+        Every word of the query has to be the prefix of a word of the entity. When nothing matches that way
+        and the query has at least three characters, names sharing most of its trigrams are returned instead.
+        Results are ordered by how closely the name matches, then by popularity (``userCount``).
+
+        Args:
+            text (str): The query, e.g. "arse" or "man city".
+            sport (str, optional): Only return entities of this sport, e.g. "football".
+            types (Iterable[str], optional): Only return entities of these types, e.g. ["team"].
+            limit (int, optional): The maximum number of results. Defaults to 10.
+
+        Returns:
+            List[Dict[str, Any]]: Entries in the format of ``Search.search_all`` results: "type", "entity" and "score".
+
+        Raises:
+            ValueError: If the sport is not a valid sport name.
+        """
+        sport_id = None
+        if sport:
+            sport = sport.lower().replace(' ', '-')
+            if sport not in self.enums["sports"]:
+                raise ValueError(f"Invalid sport: {sport}. Must be one of {list(self.enums['sports'].keys())}")
+            sport_id = self.enums["sports"][sport]
+        types = set(types) if types is not None else None
+
+        query = normalize(text)
+        words = [word[:self.max_prefix] for word in query.split()]
+        if not words:
+            return []
+
+        def wanted(key):
+            return (types is None or key[0] in types) and (sport_id is None or self.sports.get(key) == sport_id)
+
+        scores = {}
+        keys = set.intersection(*(self._prefixes.get(word, set()) for word in words))
+        for key in keys:
+            if wanted(key):
+                name = self._names[key]
+                scores[key] = 3.0 if name == query else 2.0 if name.startswith(query) else 1.0
+
+        if not scores and len(query) >= 3:
+            trigrams = _trigrams(query)
+            shared = {}
+            for trigram in trigrams:
+                for key in self._trigrams.get(trigram, ()):
+                    shared[key] = shared.get(key, 0) + 1
+            for key, count in shared.items():
+                similarity = 2 * count / (len(trigrams) + len(_trigrams(self._names[key])))
+                if similarity >= 0.5 and wanted(key):
+                    scores[key] = similarity
+
+        ranked = sorted(scores, key = lambda key: (scores[key], self.entities[key].get("userCount", 0)), reverse = True)
+        return [{"type": key[0], "entity": self.entities[key], "score": scores[key]} for key in ranked[:limit]]
@@ -0,0 +1,199 @@
+from typing import Dict, List, Any, Iterable
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+COLUMNS = ("team_id", "group", "position", "matches", "wins", "draws", "losses", "goals_for", "goals_against", "points")
+
+def _require_numpy(name: str):
+    if np is None:
+        raise ImportError(f"{name} requires numpy. Install it with: pip install sofascore-wrapper[numpy]")
+
+class StandingsTable:
+    def __init__(self, columns: Dict[str, "np.ndarray"], teams: Dict[int, str] = None, groups: List[str] = None):
+        """
+        A standings table stored as one NumPy integer array per column.
+
+        The columns are team_id, group, position, matches, wins, draws, losses, goals_for, goals_against
+        and points. ``group`` indexes ``groups`` for tournaments split into several groups. Requires NumPy,
+        install it with ``pip install sofascore-wrapper[numpy]``.
+
+        Args:
+            columns (Dict[str, np.ndarray]): The column arrays, all of the same length.
+            teams (Dict[int, str], optional): Team names keyed by team ID.
+            groups (List[str], optional): The group names. Defaults to a single unnamed group.
+
+        Raises:
+            ImportError: If NumPy is not installed.
+        """
+        _require_numpy("StandingsTable")
+        self.columns = {name: np.asarray(columns[name], dtype = np.int64) for name in COLUMNS}
+        self.teams = teams or {}
+        self.groups = groups or [None]
+        self.index = {int(team_id): row for row, team_id in enumerate(self.columns["team_id"])}
+
+    @classmethod
+    def from_standings(cls, data: Dict[str, Any]) -> "StandingsTable":
+        """
+        Builds a table from a ``League.standings``, ``standings_home`` or ``standings_away`` payload.
+        """
+        _require_numpy("StandingsTable")
+        values = {name: [] for name in COLUMNS}
+        teams = {}
+        groups = []
+
+        for group, standing in enumerate(data.get("standings", [])):
+            groups.append(standing.get("name"))
+            for row in standing.get("rows", []):
+                teams[row["team"]["id"]] = row["team"].get("name")
+                values["team_id"].append(row["team"]["id"])
+                values["group"].append(group)
+                values["position"].append(row.get("position", 0))
+                values["matches"].append(row.get("matches", 0))
+                values["wins"].append(row.get("wins", 0))
+                values["draws"].append(row.get("draws", 0))
+                values["losses"].append(row.get("losses", 0))
+                values["goals_for"].append(row.get("scoresFor", 0))
+                values["goals_against"].append(row.get("scoresAgainst", 0))
+                values["points"].append(row.get("points", 0))
+
+        return cls(values, teams, groups)
+
+    def __len__(self) -> int:
+        return len(self.columns["team_id"])
+
+    def row(self, team_id: int) -> Dict[str, int]:
+        """
+        Returns the row of a team as a dictionary.
+
+        Raises:
+            KeyError: If the team is not in the table.
+        """
+        row = self.index[team_id]
+        return {name: int(values[row]) for name, values in self.columns.items()}
+
+    def to_rows(self) -> List[Dict[str, Any]]:
+        """
+        Returns every row as a dictionary including the team name, ordered by group and position.
+        """
+        order = np.lexsort((self.columns["position"], self.columns["group"]))
+        return [
+            {"team": self.teams.get(int(self.columns["team_id"][row])), **self.row(int(self.columns["team_id"][row]))}
+            for row in order
+        ]
+
+class StandingsEngine:
+    def __init__(self, table: StandingsTable = None, win_points: int = 3, draw_points: int = 1):
+        """
+        Maintains a standings table locally from match results instead of re-downloading it.
+
+        Start either from a fetched table, then apply only the events that were not yet counted in it,
+        or from nothing and apply every finished fixture of the season. Every event's contribution is
+        remembered by event ID, so applying the same event again with a new score replaces its previous
+        contribution instead of adding to it. Positions are re-ranked by points, goal difference and
+        goals scored within each group; head-to-head tie breakers are not modelled.
+
+        Args:
+            table (StandingsTable, optional): The table to start from. Defaults to an empty table.
+            win_points (int, optional): Points for a win. Defaults to 3.
+            draw_points (int, optional): Points for a draw. Defaults to 1.
+
+        Raises:
+            ImportError: If NumPy is not installed.
+        """
+        _require_numpy("StandingsEngine")
+        if table is None:
+            table = StandingsTable({name: [] for name in COLUMNS})
+
+        self.columns = {name: values.copy() for name, values in table.columns.items()}
+        self.teams = dict(table.teams)
+        self.groups = list(table.groups)
+        self.index = dict(table.index)
+        self.win_points = win_points
+        self.draw_points = draw_points
+        self.applied = {}
+
+    def _row(self, team: Dict[str, Any]) -> int:
+        team_id = team["id"]
+        if team_id not in self.index:
+            self.index[team_id] = len(self.columns["team_id"])
+            self.teams[team_id] = team.get("name")
+            for name in COLUMNS:
+                self.columns[name] = np.append(self.columns[name], team_id if name == "team_id" else 0)
+        return self.index[team_id]
+
+    def _add(self, result: tuple, sign: int):
+        home, away, home_goals, away_goals = result
+        for row, scored, conceded in ((home, home_goals, away_goals), (away, away_goals, home_goals)):
+            self.columns["matches"][row] += sign
+            self.columns["goals_for"][row] += sign * scored
+            self.columns["goals_against"][row] += sign * conceded
+            if scored > conceded:
+                self.columns["wins"][row] += sign
+                self.columns["points"][row] += sign * self.win_points
+            elif scored == conceded:
+                self.columns["draws"][row] += sign
+                self.columns["points"][row] += sign * self.draw_points
+            else:
+                self.columns["losses"][row] += sign
+
+    def apply(self, event: Dict[str, Any]) -> bool:
+        """
+        Counts an event's current score in the table, replacing any score previously applied for it.
+
+        Args:
+            event (Dict[str, Any]): An event object with "id", "homeTeam", "awayTeam", "homeScore" and "awayScore".
+
+        Returns:
+            bool: True if the table changed.
+        """
+        result = (
+            self._row(event["homeTeam"]),
+            self._row(event["awayTeam"]),
+            event.get("homeScore", {}).get("current", 0),
+            event.get("awayScore", {}).get("current", 0)
+        )
+        previous = self.applied.get(event["id"])
+        if previous == result:
+            return False
+
+        if previous is not None:
+            self._add(previous, -1)
+        self._add(result, 1)
+        self.applied[event["id"]] = result
+        return True
+
+    def apply_many(self, events: Iterable[Dict[str, Any]]) -> bool:
+        """
+        Applies several events. Returns True if the table changed.
+        """
+        changed = False
+        for event in events:
+            changed = self.apply(event) or changed
+        return changed
+
+    def remove(self, event_id: int) -> bool:
+        """
+        Takes a previously applied event out of the table. Returns True if the table changed.
+        """
+        previous = self.applied.pop(event_id, None)
+        if previous is None:
+            return False
+        self._add(previous, -1)
+        return True
+
+    def table(self) -> StandingsTable:
+        """
+        Re-ranks the teams and returns the current table.
+        """
+        columns = self.columns
+        difference = columns["goals_for"] - columns["goals_against"]
+        order = np.lexsort((-columns["goals_for"], -difference, -columns["points"], columns["group"]))
+
+        groups = columns["group"][order]
+        starts = np.searchsorted(groups, groups, side = "left")
+        columns["position"][order] = np.arange(len(order)) - starts + 1
+
+        return StandingsTable({name: values.copy() for name, values in columns.items()}, dict(self.teams), self.groups)
@@ -1,5 +1,14 @@
-from .api import SofascoreAPI
-from typing import Dict, List, Any, Literal
+from .api import SofascoreAPI, gather_not_found
+from .pagination import iter_events
+from .player import Player
+from typing import Dict, List, Any, Literal, AsyncIterator, Iterable
+import asyncio
+
+SEASON_PARTS = {
+    "league_stats": "/team/{team}/unique-tournament/{league}/season/{season}/statistics/overall",
+    "top_players": "/team/{team}/unique-tournament/{league}/season/{season}/top-players/overall",
+    "performance_graph": "/unique-tournament/{league}/season/{season}/team/{team}/team-performance-graph-data"
+}
 
 class Team:
     def __init__(self, api: SofascoreAPI, team_id: int):
@@ -1128,6 +1137,37 @@ class Team:
         data["events"].reverse()  
         return data["events"]
 
+    async def iter_events(self, direction: Literal["last", "next"] = "last", until: int = None, limit: int = None) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Iterates over all of the team's past or upcoming events, page by page.
+
+        Unlike ``last_fixtures`` and ``next_fixtures``, which only return the first page, this walks every
+        page while requesting the next one in the background. Pages of past events that can no longer change
+        are kept in the API client's cache and not requested again as long as the team has not played a new match.
+
+        Args:
+            direction (Literal["last", "next"], optional): "last" for past events, most recent first, or "next"
+                for upcoming events, soonest first. Defaults to "last".
+            until (int, optional): A unix timestamp to stop at: events starting before it for "last", after it for "next".
+            limit (int, optional): The maximum number of events to return.
+
+        Returns:
+            AsyncIterator[Dict[str, Any]]: The event objects, in the same format as ``last_fixtures``.
+
+        Raises:
+            ValueError: If the direction is not "last" or "next".
+            Exception: If the API request fails.
+
+        Example Usage:
+            .. code-block:: python
+
+                season_start = 1723248000
+                async for event in team.iter_events("last", until = season_start):
+                    print(event["homeTeam"]["name"], event["awayTeam"]["name"])
+        """
+        async for event in iter_events(self.api, f"/team/{self.team_id}/events", direction, until, limit):
+            yield event
+
     async def seasons(self) -> Dict:
         """
         Retrieves the seasons in which the team has participated.
@@ -1183,12 +1223,100 @@ class Team:
         """
         return await self.api._get(f"/team/{self.team_id}/team-statistics/seasons")
 
-    async def squad(self) -> Dict:
+    async def season_bundle(self, seasons: Iterable[int] = None, parts: Iterable[str] = tuple(SEASON_PARTS)) -> List[Dict[str, Any]]:
+        """
+        Retrieves the league statistics, top players and performance graph of the team for every league and season
+        it played in, all concurrently.
+
+        The (league, season) pairs are planned from ``seasons()``. Every season but the most recent one of each league
+        is finished, so its responses are kept by the API client for its lifetime and later bundles only request the
+        current seasons again. A part the API has no data for (404), such as the performance graph of a cup, is
+        returned as None and listed under "errors".
+
+        Args:
+            seasons (Iterable[int], optional): Only include these season IDs. Defaults to every season.
+            parts (Iterable[str], optional): Any of "league_stats", "top_players" and "performance_graph". Defaults to all three.
+
+        Returns:
+            List[Dict[str, Any]]: One entry per (league, season) in the order of ``seasons()``, holding the league and
+                season IDs and names, whether it is the current season, one key per part and "errors".
+
+        Raises:
+            ValueError: If a part is not one of ``SEASON_PARTS``.
+            Exception: If a request fails with a status other than 404.
+
+        Example Response:
+            .. code-block:: json
+            [
+                {
+                    "league_id": 17,
+                    "league": "Premier League",
+                    "season_id": 61627,
+                    "year": "24/25",
+                    "current": true,
+                    "league_stats": {"statistics": {...}},
+                    "top_players": {"topPlayers": {...}},
+                    "performance_graph": {"graphData": [...]},
+                    "errors": {}
+                }
+            ]
+        """
+        parts = list(dict.fromkeys(parts))
+        for part in parts:
+            if part not in SEASON_PARTS:
+                raise ValueError(f"Invalid part: {part}. Must be one of {list(SEASON_PARTS)}")
+        wanted = set(seasons) if seasons is not None else None
+
+        bundle = []
+        for entry in (await self.seasons()).get("uniqueTournamentSeasons", []):
+            league = entry["uniqueTournament"]
+            for index, season in enumerate(entry.get("seasons", [])):
+                if wanted is None or season["id"] in wanted:
+                    bundle.append({
+                        "league_id": league["id"],
+                        "league": league.get("name"),
+                        "season_id": season["id"],
+                        "year": season.get("year"),
+                        "current": index == 0,
+                        "errors": {}
+                    })
+
+        async def fetch(item, part):
+            endpoint = SEASON_PARTS[part].format(team = self.team_id, league = item["league_id"], season = item["season_id"])
+            if item["current"]:
+                return await self.api._get(endpoint)
+            return await self.api._get_cached(endpoint)
+
+        plan = [(item, part) for item in bundle for part in parts]
+        results = await gather_not_found(*(fetch(item, part) for item, part in plan))
+
+        for (item, part), (result, status) in zip(plan, results):
+            item[part] = result
+            if status is not None:
+                item["errors"][part] = status
+        return bundle
+
+    async def squad(self, hydrate: Iterable[str] = None) -> Dict:
         """
         Retrieves the squad of the team.
 
+        With ``hydrate``, the requested parts of every player's profile are fetched concurrently with
+        ``Player.fetch_many`` and the squad is returned as a columnar roster instead: one list per column, all
+        in squad order. Players listed more than once are only fetched once, and profiles fetched recently,
+        e.g. for another squad, are reused.
+
+        Args:
+            hydrate (Iterable[str], optional): Player parts to fetch, any of "profile", "attributes",
+                "national_stats" and "transfer_history". Defaults to returning the squad as is.
+
         Returns:
             Dict: A dictionary containing the players in the team's squad, including their details, positions, and statistics.
+                When hydrated, a dictionary with the columns "player_id", "name", "position" and one column per
+                hydrated part, e.g. ``{"player_id": [934235, ...], "name": ["Bukayo Saka", ...], "position": ["F", ...], "attributes": [{...}, ...]}``.
+
+        Raises:
+            ValueError: If a hydrate part is not valid.
+            Exception: If fetching a player fails.
 
         Example Response:
             .. code-block:: json
@@ -1387,7 +1515,30 @@ class Team:
                 ]
             }
         """
-        return await self.api._get(f"/team/{self.team_id}/players")
+        data = await self.api._get(f"/team/{self.team_id}/players")
+        if not hydrate:
+            return data
+
+        players = list({entry["player"]["id"]: entry["player"] for entry in data.get("players", [])}.values())
+        hydrate = list(dict.fromkeys(hydrate))
+        details = {}
+        results = Player.fetch_many(self.api, (player["id"] for player in players), hydrate)
+        try:
+            async for player_id, result in results:
+                if "error" in result:
+                    raise result["error"]
+                details[player_id] = result
+        finally:
+            await results.aclose()
+
+        roster = {
+            "player_id": [player["id"] for player in players],
+            "name": [player.get("name") for player in players],
+            "position": [player.get("position") for player in players]
+        }
+        for part in hydrate:
+            roster[part] = [details[player["id"]][part] for player in players]
+        return roster
 
     async def top_players(self, league_id: int, season: int) -> Dict:
         """
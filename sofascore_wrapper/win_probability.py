@@ -0,0 +1,204 @@
+from .api import SofascoreAPI, SofascoreAPIError
+from .match import Match
+from .scheduler import BREAK_CODES
+from typing import Dict, List, Any, Iterable, Optional
+import asyncio
+import time
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+COLUMNS = ("minute", "home", "draw", "away")
+
+def match_minute(event: Dict[str, Any], now: float = None) -> Optional[int]:
+    """
+    Estimates the current match minute of an event from ``Match.get_match``.
+
+    The minute is derived from the event's "time" clock: the period's ``initial`` seconds plus the time since
+    ``currentPeriodStartTimestamp``, capped at the end of the period and its stoppage time. During a break or
+    after the match the end of the last period is used. Events without a clock fall back to the time since
+    kick-off. Returns 0 before kick-off and None if the event has no timing at all.
+    """
+    now = time.time() if now is None else now
+    status = event.get("status", {})
+    if status.get("type") == "notstarted":
+        return 0
+
+    clock = event.get("time", {})
+    start = clock.get("currentPeriodStartTimestamp")
+    if start:
+        initial = clock.get("initial", 0)
+        end = clock.get("max")
+        if status.get("type") != "inprogress" or status.get("code") in BREAK_CODES:
+            return (end if end is not None else initial) // 60
+        seconds = initial + max(0, now - start)
+        if end is not None:
+            seconds = min(seconds, end + clock.get("extra", 0))
+        return int(seconds // 60) + 1
+
+    if event.get("startTimestamp"):
+        return int(max(0, now - event["startTimestamp"]) // 60) + 1
+    return None
+
+class WinProbabilityCollector:
+    def __init__(self, api: SofascoreAPI):
+        """
+        Merges successive win-probability responses into one deduplicated per-minute curve per match.
+
+        Each match's curve is a NumPy array with one row per minute and the columns minute, home, draw
+        and away. When a minute is seen again the newest values replace the old ones. Requires NumPy,
+        install it with ``pip install sofascore-wrapper[numpy]``.
+
+        Args:
+            api (SofascoreAPI): An instance of the SofascoreAPI class.
+
+        Raises:
+            ImportError: If NumPy is not installed.
+        """
+        if np is None:
+            raise ImportError("WinProbabilityCollector requires numpy. Install it with: pip install sofascore-wrapper[numpy]")
+
+        self.api = api
+        self.curves = {}
+        self.errors = {}
+
+    @staticmethod
+    def _raw_points(data: Dict[str, Any]) -> List[Dict[str, Any]]:
+        points = data.get("winProbability", data.get("graphPoints", data))
+        return [points] if isinstance(points, dict) else points
+
+    @classmethod
+    def _points(cls, data: Dict[str, Any], minute: int = None) -> List[List[float]]:
+        points = cls._raw_points(data)
+
+        rows = []
+        for point in points:
+            point_minute = point.get("minute", minute)
+            if point_minute is None:
+                continue
+            rows.append([
+                point_minute,
+                point.get("homeWin", point.get("home", np.nan)),
+                point.get("draw", np.nan),
+                point.get("awayWin", point.get("away", np.nan))
+            ])
+        return rows
+
+    def update(self, match_id: int, data: Dict[str, Any], minute: int = None) -> "np.ndarray":
+        """
+        Merges a ``Match.win_probability`` payload into the match's curve.
+
+        Args:
+            match_id (int): The ID of the match the payload belongs to.
+            data (Dict[str, Any]): The win-probability payload. Either a list of points, each with a "minute" and
+                "homeWin", "draw" and "awayWin" values, or a single current point.
+            minute (int, optional): The match minute of points that do not carry one themselves. Such points
+                are skipped when it is not given; ``poll`` works it out from the match clock.
+
+        Returns:
+            np.ndarray: The match's merged curve, sorted by minute.
+
+        Example Response:
+            .. code-block:: python
+
+                array([[ 1. , 45.2, 30.1, 24.7],
+                       [ 2. , 46.0, 29.8, 24.2]])
+        """
+        rows = self._points(data, minute)
+        curve = self.curves.get(match_id)
+        if not rows:
+            return curve if curve is not None else np.empty((0, len(COLUMNS)))
+
+        new = np.asarray(rows, dtype = float)
+        merged = new if curve is None else np.concatenate([curve, new])
+
+        # np.unique keeps the first occurrence, so search the reversed rows to keep the newest value per minute
+        reversed_rows = merged[::-1]
+        _, index = np.unique(reversed_rows[:, 0], return_index = True)
+        self.curves[match_id] = reversed_rows[index]
+        return self.curves[match_id]
+
+    async def poll(self, match_id: int, minute: int = None) -> "np.ndarray":
+        """
+        Fetches the current win probability of a match and merges it with ``update``.
+
+        When the payload is a single current point without a minute and none is given, the match is fetched
+        with ``Match.get_match`` and the minute is estimated from its clock with ``match_minute``.
+
+        Raises:
+            Exception: If the API request fails or returns an error.
+        """
+        match = Match(self.api, match_id)
+        data = await match.win_probability()
+        if minute is None and any("minute" not in point for point in self._raw_points(data)):
+            event = await match.get_match()
+            minute = match_minute(event.get("event", event))
+        return self.update(match_id, data, minute)
+
+    async def poll_many(self, match_ids: Iterable[int]) -> Dict[int, Exception]:
+        """
+        Polls several matches concurrently.
+
+        Matches without win-probability data (404) are skipped. Other failures do not stop the remaining
+        matches; the latest error of each match is kept in ``errors`` and also returned.
+
+        Returns:
+            Dict[int, Exception]: The errors of the matches that failed in this call.
+        """
+        match_ids = list(dict.fromkeys(match_ids))
+        results = await asyncio.gather(*(self.poll(match_id) for match_id in match_ids), return_exceptions = True)
+
+        failed = {}
+        for match_id, result in zip(match_ids, results):
+            if isinstance(result, SofascoreAPIError) and result.status == 404:
+                continue
+            if isinstance(result, BaseException):
+                if not isinstance(result, Exception):
+                    raise result
+                failed[match_id] = result
+                self.errors[match_id] = result
+            else:
+                self.errors.pop(match_id, None)
+        return failed
+
+    def curve(self, match_id: int) -> "np.ndarray":
+        """
+        Returns the merged curve of a match, with the columns minute, home, draw and away.
+        """
+        curve = self.curves.get(match_id)
+        return curve if curve is not None else np.empty((0, len(COLUMNS)))
+
+    def to_array(self, match_ids: Iterable[int] = None) -> "np.ndarray":
+        """
+        Stacks the curves of many matches into a single array.
+
+        Args:
+            match_ids (Iterable[int], optional): The matches to export. Defaults to every collected match.
+
+        Returns:
+            np.ndarray: An array with the columns match_id, minute, home, draw and away.
+        """
+        match_ids = list(self.curves) if match_ids is None else list(match_ids)
+        curves = [self.curve(match_id) for match_id in match_ids]
+        if not curves:
+            return np.empty((0, len(COLUMNS) + 1))
+
+        ids = np.repeat(np.asarray(match_ids, dtype = float), [len(curve) for curve in curves])
+        return np.column_stack([ids, np.concatenate(curves)])
+
+    def to_frame(self, match_ids: Iterable[int] = None):
+        """
+        Exports the curves of many matches as a pandas DataFrame with the columns match_id, minute, home, draw and away.
+
+        Raises:
+            ImportError: If pandas is not installed.
+        """
+        try:
+            import pandas as pd
+        except ImportError:
+            raise ImportError("to_frame requires pandas. Install it with: pip install pandas")
+
+        frame = pd.DataFrame(self.to_array(match_ids), columns = ("match_id",) + COLUMNS)
+        return frame.astype({"match_id": int, "minute": int})